@@ -0,0 +1,49 @@
+"""store money amounts as bigint
+
+Revision ID: 7a6c1e93d4b2
+Revises: e5a08c47b3f1
+Create Date: 2026-10-17 11:04:18.532907
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "7a6c1e93d4b2"
+down_revision: str | None = "e5a08c47b3f1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, scale, nullable) for amounts moved to BIGINT minor units
+_AMOUNT_COLUMNS = [
+    ("accounts", "opening_balance_amount", 4, False),
+    ("accounts", "credit_limit_amount", 4, True),
+    ("accounts", "rewards_value", 0, True),
+    ("transactions", "amount", 4, False),
+    ("split_lines", "amount", 4, False),
+]
+
+
+def upgrade() -> None:
+    for table, column, scale, nullable in _AMOUNT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Numeric(precision=19, scale=scale),
+            type_=sa.BigInteger(),
+            existing_nullable=nullable,
+            postgresql_using=f"round({column} * {10**scale})::bigint",
+        )
+
+
+def downgrade() -> None:
+    for table, column, scale, nullable in _AMOUNT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.BigInteger(),
+            type_=sa.Numeric(precision=19, scale=scale),
+            existing_nullable=nullable,
+            postgresql_using=f"({column}::numeric / {10**scale})::numeric(19, {scale})",
+        )
@@ -0,0 +1,47 @@
+"""server side timestamp defaults
+
+Revision ID: e5a08c47b3f1
+Revises: 9d31f0c6e2a8
+Create Date: 2026-10-17 10:21:56.804117
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e5a08c47b3f1"
+down_revision: str | None = "9d31f0c6e2a8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column) pairs whose defaults moved from Python to the database clock
+_TIMESTAMP_COLUMNS = [
+    ("outbox", "created_at"),
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("encrypted_secrets", "created_at"),
+    ("encrypted_secrets", "updated_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.text("now()"),
+        )
+
+
+def downgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=None,
+        )
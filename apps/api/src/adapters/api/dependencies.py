@@ -21,7 +21,7 @@ from fastapi.security import OAuth2PasswordBearer
 
 from domain.model.entity_id import HouseholdId, UserId
 from src.adapters.logging import get_logger
-from src.adapters.persistence.database import create_sync_session_factory
+from src.adapters.persistence.database import get_database_url, make_uow_factory
 from src.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from src.adapters.security.encryption import FieldEncryption
 from src.adapters.security.jwt import TokenError, decode_access_token
@@ -68,9 +68,10 @@ def get_encryption() -> FieldEncryption:
     """
     Provide encryption service.
     Attempts Docker secrets first, falls back to env var.
+    The secret-backed instance is loaded once and shared.
     """
     try:
-        return FieldEncryption.from_docker_secret()
+        return FieldEncryption.default()
     except FileNotFoundError:
         logger.warning("docker_secret_not_found", fallback="environment_variable")
         return FieldEncryption.from_env()
@@ -79,13 +80,14 @@ def get_encryption() -> FieldEncryption:
 def get_unit_of_work() -> SqlAlchemyUnitOfWork:
     """Provide Unit of Work for the request.
 
-    Creates a new UnitOfWork with a sync session factory.
+    Creates a new UnitOfWork backed by the shared, pooled session
+    factory for the configured database.
     The UnitOfWork manages its own transaction lifecycle.
 
     Returns:
         SqlAlchemyUnitOfWork instance.
     """
-    session_factory = create_sync_session_factory()
+    session_factory = make_uow_factory(get_database_url())
     return SqlAlchemyUnitOfWork(session_factory)
 
 
@@ -10,6 +10,7 @@ local Docker Compose development.
 
 import os
 from collections.abc import Generator
+from functools import lru_cache
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import (
@@ -19,6 +20,21 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import Session, sessionmaker
 
+# Rows per INSERT statement when SQLAlchemy batches executemany() calls
+# (split lines, bulk imports). Larger pages mean fewer round trips.
+INSERTMANYVALUES_PAGE_SIZE = 1000
+
+# Compiled-statement cache entries per engine. Repository queries bind their
+# values as parameters, so each query shape compiles once and is reused.
+QUERY_CACHE_SIZE = 1200
+
+# Connection pool sizing for the request-serving engine. Connections are
+# checked with a ping before use and recycled before Postgres or any proxy
+# in between drops them as idle.
+POOL_SIZE = 50
+MAX_OVERFLOW = 10
+POOL_RECYCLE_SECONDS = 1800
+
 
 def get_database_url() -> str:
     """Get database URL from environment.
@@ -72,7 +88,12 @@ def create_sync_engine(echo: bool = False):
     Returns:
         SQLAlchemy sync Engine.
     """
-    return create_engine(get_database_url(), echo=echo)
+    return create_engine(
+        get_database_url(),
+        echo=echo,
+        insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
 
 
 def create_async_engine_instance(echo: bool = False):
@@ -88,7 +109,12 @@ def create_async_engine_instance(echo: bool = False):
     Returns:
         SQLAlchemy async Engine.
     """
-    return create_async_engine(get_async_database_url(), echo=echo)
+    return create_async_engine(
+        get_async_database_url(),
+        echo=echo,
+        insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
 
 
 def create_sync_session_factory(echo: bool = False) -> sessionmaker[Session]:
@@ -104,6 +130,35 @@ def create_sync_session_factory(echo: bool = False) -> sessionmaker[Session]:
     return sessionmaker(bind=engine, expire_on_commit=False)
 
 
+@lru_cache
+def make_uow_factory(dsn: str) -> sessionmaker[Session]:
+    """Create the pooled session factory used by request-scoped UnitOfWorks.
+
+    Unlike create_sync_session_factory, the engine has a tuned connection
+    pool, and the factory is cached per DSN so every request shares one
+    engine and pool instead of opening fresh connections.
+
+    Sessions use expire_on_commit=False so entities returned after
+    commit() don't trigger a reload round trip on attribute access.
+
+    Args:
+        dsn: Sync PostgreSQL connection string.
+
+    Returns:
+        Sessionmaker bound to the pooled engine.
+    """
+    engine = create_engine(
+        dsn,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+        insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
 def create_async_session_factory(
     echo: bool = False,
 ) -> async_sessionmaker[AsyncSession]:
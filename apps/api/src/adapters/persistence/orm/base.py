@@ -10,6 +10,8 @@ which is essential for:
 - Cross-database compatibility
 """
 
+import os
+
 from sqlalchemy import MetaData
 from sqlalchemy.orm import registry
 
@@ -25,3 +27,7 @@ convention = {
 
 metadata = MetaData(naming_convention=convention)
 mapper_registry = registry(metadata=metadata)
+
+# Repository reads apply raiseload("*") when enabled, so an unexpected
+# relationship access raises instead of issuing a hidden lazy-load SELECT.
+STRICT_LOADING = os.getenv("STRICT_LOADING", "true").lower() == "true"
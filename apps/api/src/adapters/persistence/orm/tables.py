@@ -18,8 +18,6 @@ Custom type decorators handle domain type conversion for EntityIds and Enums.
 # accepts Column, Index, and ForeignKey objects as positional args, but pyright
 # cannot fully resolve the complex overloaded signatures.
 
-from datetime import UTC, datetime
-
 from sqlalchemy import (
     Boolean,
     Column,
@@ -32,8 +30,9 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    func,
 )
-from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 
 from .base import metadata
 from .types import (
@@ -43,6 +42,7 @@ from .types import (
     AccountTypeEnum,
     CategoryIdType,
     HouseholdIdType,
+    MoneyAmountType,
     PayeeIdType,
     SplitIdType,
     TransactionIdType,
@@ -61,12 +61,12 @@ outbox = Table(
     Column("event_type", String(255), nullable=False),
     Column("aggregate_type", String(255), nullable=False),
     Column("aggregate_id", String(36), nullable=False),
-    Column("payload", Text, nullable=False),  # JSON serialized
+    Column("payload", JSONB, nullable=False),  # Event.to_dict()
     Column(
         "created_at",
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
     ),
     Column("processed_at", DateTime(timezone=True), nullable=True),
     # Partial index for efficient polling of unprocessed events
@@ -112,14 +112,14 @@ users = Table(
         "created_at",
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
     ),
     Column(
         "updated_at",
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     ),
     Index("ix_users_email", "email", unique=True),
     Index("ix_users_household_id", "household_id"),
@@ -138,13 +138,14 @@ encrypted_secrets = Table(
         "created_at",
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
     ),
     Column(
         "updated_at",
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     ),
     # Unique constraint: one secret type per user
     Index("ix_encrypted_secrets_user_type", "user_id", "secret_type", unique=True),
@@ -171,18 +172,18 @@ accounts = Table(
     Column("account_type", AccountTypeEnum(50), nullable=False),  # Discriminator
     Column("status", AccountStatusEnum(20), nullable=False, default="active"),
     Column("subtype", AccountSubtypeEnum(50), nullable=True),
-    # Balance tracking
-    Column("opening_balance_amount", Numeric(19, 4), nullable=False),
+    # Balance tracking (BIGINT ten-thousandths, see MoneyAmountType)
+    Column("opening_balance_amount", MoneyAmountType(), nullable=False),
     Column("opening_balance_currency", String(3), nullable=False),
     Column("opening_date", DateTime(timezone=True), nullable=False),
     # Type-specific fields (nullable for types that don't use them)
-    Column("credit_limit_amount", Numeric(19, 4), nullable=True),
+    Column("credit_limit_amount", MoneyAmountType(), nullable=True),
     Column("credit_limit_currency", String(3), nullable=True),
     Column("apr", Numeric(5, 4), nullable=True),  # e.g., 0.1999 for 19.99%
     Column("term_months", Integer, nullable=True),
     Column("due_date", DateTime(timezone=True), nullable=True),
     # Rewards-specific
-    Column("rewards_value", Numeric(19, 0), nullable=True),
+    Column("rewards_value", MoneyAmountType(scale=0), nullable=True),
     Column("rewards_unit", String(100), nullable=True),
     # Institution
     Column("institution_name", String(255), nullable=True),
@@ -200,8 +201,7 @@ accounts = Table(
     Column("updated_at", DateTime(timezone=True), nullable=False),
     Column("created_by", UserIdType(36), nullable=True),
     Column("updated_by", UserIdType(36), nullable=True),
-    # Indexes
-    Index("ix_accounts_user_id", "user_id"),
+    # Indexes (user_id-only lookups use the leftmost prefix of the composites)
     Index("ix_accounts_household_id", "household_id"),
     Index("ix_accounts_user_type", "user_id", "account_type"),
     Index("ix_accounts_user_status", "user_id", "status"),
@@ -271,7 +271,14 @@ payees = Table(
     # Indexes
     Index("ix_payees_user_id", "user_id"),
     Index("ix_payees_household_id", "household_id"),
-    Index("ix_payees_user_normalized", "user_id", "normalized_name"),
+    # text_pattern_ops serves equality (find/upsert) and LIKE 'prefix%' search
+    Index(
+        "ix_payees_user_normalized",
+        "user_id",
+        "normalized_name",
+        unique=True,
+        postgresql_ops={"normalized_name": "text_pattern_ops"},
+    ),
 )
 
 # Transactions table (always-split model per CONTEXT)
@@ -292,7 +299,7 @@ transactions = Table(
     Column("effective_date", Date, nullable=False),
     Column("posted_date", Date, nullable=True),  # None = pending
     # Amount: net flow to account (positive = inflow, negative = outflow)
-    Column("amount", Numeric(19, 4), nullable=False),
+    Column("amount", MoneyAmountType(), nullable=False),
     Column("currency", String(3), nullable=False, default="USD"),
     # Status and source
     Column("status", TransactionStatusEnum(20), nullable=False, default="pending"),
@@ -319,8 +326,7 @@ transactions = Table(
     Column("updated_at", DateTime(timezone=True), nullable=False),
     # Full-text search vector (updated by application)
     Column("search_vector", TSVECTOR, nullable=True),
-    # Indexes
-    Index("ix_transactions_user_id", "user_id"),
+    # Indexes (user_id-only lookups use the leftmost prefix of the composites)
     Index("ix_transactions_household_id", "household_id"),
     Index("ix_transactions_account_id", "account_id"),
     Index("ix_transactions_user_effective_date", "user_id", "effective_date"),
@@ -328,6 +334,15 @@ transactions = Table(
     Index("ix_transactions_source_transaction", "source_transaction_id"),
     Index("ix_transactions_source_split_id", "source_split_id"),
     Index("ix_transactions_search", "search_vector", postgresql_using="gin"),
+    # At most one mirror per source split (guards against duplicate mirrors
+    # under concurrent writes and serves "find the mirror of this split")
+    Index(
+        "ux_transactions_mirror",
+        "source_transaction_id",
+        "source_split_id",
+        unique=True,
+        postgresql_where=Column("is_mirror").is_(True),
+    ),
 )
 
 # Split lines table (always 1+ per transaction)
@@ -338,7 +353,7 @@ split_lines = Table(
     "split_lines",
     metadata,
     Column("id", Integer, primary_key=True, autoincrement=True),
-    Column("split_id", String(36), nullable=False),  # TypeID for split identity
+    Column("split_id", SplitIdType(36), nullable=False),  # TypeID for split identity
     Column(
         "transaction_id",
         TransactionIdType(36),
@@ -346,7 +361,7 @@ split_lines = Table(
         nullable=False,
     ),
     # Amount: signed (positive = income/inflow, negative = expense/outflow)
-    Column("amount", Numeric(19, 4), nullable=False),
+    Column("amount", MoneyAmountType(), nullable=False),
     Column("currency", String(3), nullable=False, default="USD"),
     # Either category OR transfer account (not both, enforced by application)
     Column(
@@ -2,7 +2,12 @@
 
 These type decorators handle conversion between domain value objects
 and their database representations, enabling transparent persistence
-of domain types like EntityIds and Enums.
+of domain types like EntityIds and Enums. EntityId columns load as their
+value objects; enum columns still load as strings and are converted in
+the repositories.
+
+Monetary amounts are stored as fixed-width BIGINT minor units (see
+MoneyAmountType) and surface as Decimal so Money can be rebuilt unchanged.
 
 """
 # pyright: reportMissingTypeArgument=false
@@ -13,7 +18,9 @@ of domain types like EntityIds and Enums.
 # str at the type level, but the isinstance checks are needed for runtime safety
 # when values come from the database as plain strings.
 
-from sqlalchemy import String
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import BigInteger, String
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.types import TypeDecorator
 
@@ -49,9 +56,13 @@ class AccountIdType(TypeDecorator):
             return value
         return str(value)
 
-    def process_result_value(self, value: str | None, dialect: Dialect) -> str | None:
-        """Return string value - conversion to AccountId done in repository."""
-        return value
+    def process_result_value(
+        self, value: str | None, dialect: Dialect
+    ) -> AccountId | None:
+        """Wrap database string as AccountId (validated when generated)."""
+        if value is None:
+            return None
+        return AccountId(value)
 
 
 class UserIdType(TypeDecorator):
@@ -73,9 +84,13 @@ class UserIdType(TypeDecorator):
             return value
         return str(value)
 
-    def process_result_value(self, value: str | None, dialect: Dialect) -> str | None:
-        """Return string value - conversion to UserId done in repository."""
-        return value
+    def process_result_value(
+        self, value: str | None, dialect: Dialect
+    ) -> UserId | None:
+        """Wrap database string as UserId (validated when generated)."""
+        if value is None:
+            return None
+        return UserId(value)
 
 
 class AccountTypeEnum(TypeDecorator):
@@ -169,9 +184,13 @@ class TransactionIdType(TypeDecorator):
             return value
         return str(value)
 
-    def process_result_value(self, value: str | None, dialect: Dialect) -> str | None:
-        """Return string value - conversion to TransactionId done in repository."""
-        return value
+    def process_result_value(
+        self, value: str | None, dialect: Dialect
+    ) -> TransactionId | None:
+        """Wrap database string as TransactionId (validated when generated)."""
+        if value is None:
+            return None
+        return TransactionId(value)
 
 
 class CategoryIdType(TypeDecorator):
@@ -193,9 +212,13 @@ class CategoryIdType(TypeDecorator):
             return value
         return str(value)
 
-    def process_result_value(self, value: str | None, dialect: Dialect) -> str | None:
-        """Return string value - conversion to CategoryId done in repository."""
-        return value
+    def process_result_value(
+        self, value: str | None, dialect: Dialect
+    ) -> CategoryId | None:
+        """Wrap database string as CategoryId (validated when generated)."""
+        if value is None:
+            return None
+        return CategoryId(value)
 
 
 class PayeeIdType(TypeDecorator):
@@ -217,9 +240,13 @@ class PayeeIdType(TypeDecorator):
             return value
         return str(value)
 
-    def process_result_value(self, value: str | None, dialect: Dialect) -> str | None:
-        """Return string value - conversion to PayeeId done in repository."""
-        return value
+    def process_result_value(
+        self, value: str | None, dialect: Dialect
+    ) -> PayeeId | None:
+        """Wrap database string as PayeeId (validated when generated)."""
+        if value is None:
+            return None
+        return PayeeId(value)
 
 
 class TransactionStatusEnum(TypeDecorator):
@@ -289,9 +316,13 @@ class SplitIdType(TypeDecorator):
             return value
         return str(value)
 
-    def process_result_value(self, value: str | None, dialect: Dialect) -> str | None:
-        """Return string value - conversion to SplitId done in repository."""
-        return value
+    def process_result_value(
+        self, value: str | None, dialect: Dialect
+    ) -> SplitId | None:
+        """Wrap database string as SplitId (validated when generated)."""
+        if value is None:
+            return None
+        return SplitId(value)
 
 
 class HouseholdIdType(TypeDecorator):
@@ -313,6 +344,46 @@ class HouseholdIdType(TypeDecorator):
             return value
         return str(value)
 
-    def process_result_value(self, value: str | None, dialect: Dialect) -> str | None:
-        """Return string value - conversion to HouseholdId done in repository."""
-        return value
+    def process_result_value(
+        self, value: str | None, dialect: Dialect
+    ) -> HouseholdId | None:
+        """Wrap database string as HouseholdId (validated when generated)."""
+        if value is None:
+            return None
+        return HouseholdId(value)
+
+
+class MoneyAmountType(TypeDecorator):
+    """SQLAlchemy type for Decimal amounts stored as BIGINT minor units.
+
+    Money carries four decimal places, so the default scale stores amounts as
+    integer ten-thousandths (1.2345 -> 12345). Use scale=0 for whole-unit
+    values such as rewards points. Results come back as Decimal with the same
+    precision Numeric(19, scale) produced.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def __init__(self, scale: int = 4) -> None:
+        super().__init__()
+        self.scale = scale
+        self._factor = 10**scale
+        self._quantum = Decimal(1).scaleb(-scale)
+
+    def process_bind_param(
+        self, value: Decimal | int | str | None, dialect: Dialect
+    ) -> int | None:
+        """Convert a Decimal amount to integer minor units."""
+        if value is None:
+            return None
+        scaled = Decimal(str(value)) * self._factor
+        return int(scaled.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+    def process_result_value(
+        self, value: int | None, dialect: Dialect
+    ) -> Decimal | None:
+        """Convert integer minor units back to a Decimal amount."""
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-self.scale).quantize(self._quantum)
@@ -1,15 +1,22 @@
 """Persistence repositories package.
 
 SQLAlchemy implementations of domain repository protocols.
+
+Repositories are imported lazily on first attribute access (PEP 562) so that
+importing a single repository module does not load the others.
 """
 
-from .account import SqlAlchemyAccountRepository
-from .category import SqlAlchemyCategoryRepository
-from .household import HouseholdRepository
-from .payee import SqlAlchemyPayeeRepository
-from .refresh_token import RefreshTokenRepository
-from .transaction import SqlAlchemyTransactionRepository
-from .user import UserRepository
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .account import SqlAlchemyAccountRepository
+    from .category import SqlAlchemyCategoryRepository
+    from .household import HouseholdRepository
+    from .payee import SqlAlchemyPayeeRepository
+    from .refresh_token import RefreshTokenRepository
+    from .transaction import SqlAlchemyTransactionRepository
+    from .user import UserRepository
 
 __all__ = [
     "HouseholdRepository",
@@ -20,3 +27,26 @@ __all__ = [
     "SqlAlchemyTransactionRepository",
     "UserRepository",
 ]
+
+_MODULES = {
+    "HouseholdRepository": "household",
+    "RefreshTokenRepository": "refresh_token",
+    "SqlAlchemyAccountRepository": "account",
+    "SqlAlchemyCategoryRepository": "category",
+    "SqlAlchemyPayeeRepository": "payee",
+    "SqlAlchemyTransactionRepository": "transaction",
+    "UserRepository": "user",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
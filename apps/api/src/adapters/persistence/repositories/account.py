@@ -10,13 +10,22 @@ types. The type: ignore comments on .where() and .order_by() clauses are
 expected and correct.
 """
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, delete, exists, or_, select
 from sqlalchemy.orm import Session
 
 from domain.exceptions import EntityNotFoundError
 from domain.model.account import Account
 from domain.model.account_types import AccountStatus, AccountSubtype, AccountType
 from domain.model.entity_id import AccountId, HouseholdId, UserId
+from src.adapters.persistence.orm.tables import accounts, split_lines, transactions
+
+
+def _referenced_by_transactions(account_id: AccountId) -> ColumnElement[bool]:
+    """EXISTS predicate: a transaction or transfer split uses the account."""
+    return or_(
+        exists().where(transactions.c.account_id == account_id),
+        exists().where(split_lines.c.transfer_account_id == account_id),
+    )
 
 
 class SqlAlchemyAccountRepository:
@@ -52,9 +61,9 @@ class SqlAlchemyAccountRepository:
         Returns:
             Account entity with reconstructed EntityIds and Enums, or None.
         """
-        account = self._session.get(Account, str(account_id))
+        account = self._session.get(Account, account_id)
         if account is not None:
-            self._reconstruct_entity_ids_and_enums(account)
+            self._reconstruct_enums(account)
         return account
 
     def get_or_raise(self, account_id: AccountId) -> Account:
@@ -110,10 +119,10 @@ class SqlAlchemyAccountRepository:
         stmt = stmt.order_by(Account.sort_order, Account.name)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping: int/str attrs become Column at runtime
 
         result = self._session.execute(stmt)
-        accounts = list(result.scalars().all())
+        accounts = list(result.scalars())
 
         for account in accounts:
-            self._reconstruct_entity_ids_and_enums(account)
+            self._reconstruct_enums(account)
 
         return accounts
 
@@ -149,10 +158,10 @@ class SqlAlchemyAccountRepository:
         stmt = stmt.order_by(Account.sort_order, Account.name)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping: int/str attrs become Column at runtime
 
         result = self._session.execute(stmt)
-        accounts = list(result.scalars().all())
+        accounts = list(result.scalars())
 
         for account in accounts:
-            self._reconstruct_entity_ids_and_enums(account)
+            self._reconstruct_enums(account)
 
         return accounts
 
@@ -164,27 +173,64 @@ class SqlAlchemyAccountRepository:
         """
         self._session.delete(account)
 
+    def delete_if_no_transactions(
+        self,
+        account_id: AccountId,
+        household_id: HouseholdId | None = None,
+    ) -> bool | None:
+        """Delete an account unless transactions reference it.
+
+        The usage check runs inside the DELETE (NOT EXISTS), so a successful
+        delete is a single round trip. Only when nothing was deleted does a
+        second query tell a missing account from one still in use.
+
+        Args:
+            account_id: The account to delete.
+            household_id: Optional household the account must belong to.
+
+        Returns:
+            True if deleted, False if transactions reference the account,
+            None if it doesn't exist (or belongs to another household).
+        """
+        stmt = (
+            delete(accounts)
+            .where(accounts.c.id == account_id)
+            .where(~_referenced_by_transactions(account_id))
+            .returning(accounts.c.id)
+        )
+        if household_id is not None:
+            stmt = stmt.where(accounts.c.household_id == household_id)
+        if self._session.execute(stmt).first() is not None:
+            return True
+
+        owner = self._session.scalar(
+            select(accounts.c.household_id).where(accounts.c.id == account_id)
+        )
+        if owner is None or (household_id is not None and owner != household_id):
+            return None
+        return False
+
     def has_transactions(self, account_id: AccountId) -> bool:
         """Check if account has any transactions.
 
-        Note: Transactions table is added in Phase 3.
-        For now, always returns False (accounts can be deleted).
+        Counts both transactions posted to the account and transfer
+        splits that point at it. EXISTS stops at the first match.
 
         Args:
             account_id: The account identifier.
 
         Returns:
             True if account has transactions, False otherwise.
-
-        TODO: Implement in Phase 3 when transactions table exists.
         """
-        return False
+        stmt = select(_referenced_by_transactions(account_id))
+        return bool(self._session.scalar(stmt))
 
-    def _reconstruct_entity_ids_and_enums(self, account: Account) -> None:
-        """Reconstruct EntityIds and Enums from database strings.
+    def _reconstruct_enums(self, account: Account) -> None:
+        """Reconstruct Enums from database strings.
 
-        TypeDecorators return strings from the database. This method converts
-        them to domain types (EntityIds and Enums).
+        EntityId columns already load as value objects via their
+        TypeDecorators. Enum TypeDecorators return strings from the database;
+        this method converts them to domain enums.
 
         Value objects (Money, InstitutionDetails, RewardsBalance) are
         automatically handled by composite() mappings and don't need
@@ -193,20 +239,6 @@ class SqlAlchemyAccountRepository:
         Args:
             account: Account entity loaded from database.
         """
-        # Reconstruct AccountId and UserId from strings
-        if isinstance(account.id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB, isinstance narrows for reconstruction
-            object.__setattr__(account, "id", AccountId.from_string(account.id))  # type: ignore[arg-type]  # str at runtime from DB
-        if isinstance(account.user_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(account, "user_id", UserId.from_string(account.user_id))  # type: ignore[arg-type]  # str at runtime from DB
-
-        # Reconstruct HouseholdId from string
-        if hasattr(account, "household_id") and isinstance(account.household_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(
-                account,
-                "household_id",
-                HouseholdId.from_string(account.household_id),  # type: ignore[arg-type]  # str at runtime from DB
-            )
-
         # Reconstruct enums from string values
         if isinstance(account.account_type, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
             object.__setattr__(
@@ -217,16 +249,6 @@ class SqlAlchemyAccountRepository:
         if account.subtype is not None and isinstance(account.subtype, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
             object.__setattr__(account, "subtype", AccountSubtype(account.subtype))
 
-        # Reconstruct created_by and updated_by UserId
-        if account.created_by is not None and isinstance(account.created_by, str):
-            object.__setattr__(
-                account, "created_by", UserId.from_string(account.created_by)
-            )
-        if account.updated_by is not None and isinstance(account.updated_by, str):
-            object.__setattr__(
-                account, "updated_by", UserId.from_string(account.updated_by)
-            )
-
         # Ensure _events list exists (transient field, not loaded from DB)
         if not hasattr(account, "_events") or getattr(account, "_events", None) is None:
             object.__setattr__(account, "_events", [])
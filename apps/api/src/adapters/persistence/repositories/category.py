@@ -8,8 +8,10 @@ types. The type: ignore comments on .where() and .order_by() clauses are
 expected and correct.
 """
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from typing import Any
+
+from sqlalchemy import Row, bindparam, exists, func, select
+from sqlalchemy.orm import Session, raiseload
 
 from domain.model.category import (
     SYSTEM_CATEGORY_UNCATEGORIZED,
@@ -17,7 +19,41 @@ from domain.model.category import (
     CategoryType,
 )
 from domain.model.entity_id import CategoryId, HouseholdId, UserId
-from src.adapters.persistence.orm.tables import split_lines
+from src.adapters.persistence.orm.base import STRICT_LOADING
+from src.adapters.persistence.orm.tables import categories, split_lines
+
+# Loader options for ORM reads (see STRICT_LOADING)
+_load_options = (raiseload("*"),) if STRICT_LOADING else ()
+
+# Core selects for read-only list queries (bypass ORM identity map/loading)
+_select_by_user = (
+    select(categories)
+    .where(categories.c.user_id == bindparam("user_id"))
+    .order_by(categories.c.sort_order, categories.c.name)
+)
+_select_children = (
+    select(categories)
+    .where(categories.c.parent_id == bindparam("parent_id"))
+    .order_by(categories.c.sort_order, categories.c.name)
+)
+
+
+def _category_from_row(row: Row[Any]) -> Category:
+    """Build a detached Category from a categories table row."""
+    return Category(
+        id=row.id,
+        user_id=row.user_id,
+        household_id=row.household_id,
+        name=row.name,
+        parent_id=row.parent_id,
+        category_type=CategoryType(row.category_type),
+        is_system=row.is_system,
+        is_hidden=row.is_hidden,
+        sort_order=row.sort_order,
+        icon=row.icon,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
 
 
 class SqlAlchemyCategoryRepository:
@@ -33,6 +69,9 @@ class SqlAlchemyCategoryRepository:
             session: Active SQLAlchemy session for database operations.
         """
         self._session = session
+        # Uncategorized lookups are by (user, name), not PK, so the identity
+        # map can't answer them. Lives as long as the repository (one UoW).
+        self._uncategorized: dict[UserId, Category] = {}
 
     def add(self, category: Category) -> None:
         """Add a new category to the session.
@@ -51,7 +90,7 @@ class SqlAlchemyCategoryRepository:
         Returns:
             Category entity or None if not found.
         """
-        category = self._session.get(Category, str(category_id))
+        category = self._session.get(Category, category_id)
         if category is not None:
             self._reconstruct_value_objects(category)
         return category
@@ -59,50 +98,31 @@ class SqlAlchemyCategoryRepository:
     def get_by_user(self, user_id: UserId) -> list[Category]:
         """Get all categories for a user (including system categories).
 
+        Read-only list path: rows are fetched through Core and returned as
+        detached entities. Use get() to load a category for modification.
+
         Args:
             user_id: The user identifier.
 
         Returns:
             List of Category entities ordered by sort_order and name.
         """
-        stmt = (
-            select(Category)
-            .where(
-                Category.user_id == str(user_id)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping: domain attr becomes Column at runtime
-            )
-            .order_by(Category.sort_order, Category.name)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping: int/str attrs become Column at runtime
-        )
-        result = self._session.execute(stmt)
-        categories = list(result.scalars().all())
-
-        for category in categories:
-            self._reconstruct_value_objects(category)
-
-        return categories
+        rows = self._session.execute(_select_by_user, {"user_id": str(user_id)})
+        return [_category_from_row(row) for row in rows]
 
     def get_children(self, parent_id: CategoryId) -> list[Category]:
         """Get child categories of a parent.
 
+        Read-only list path, see get_by_user().
+
         Args:
             parent_id: The parent category identifier.
 
         Returns:
             List of child Category entities.
         """
-        stmt = (
-            select(Category)
-            .where(
-                Category.parent_id == str(parent_id)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping: domain attr becomes Column at runtime
-            )
-            .order_by(Category.sort_order, Category.name)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
-        )
-        result = self._session.execute(stmt)
-        children = list(result.scalars().all())
-
-        for category in children:
-            self._reconstruct_value_objects(category)
-
-        return children
+        rows = self._session.execute(_select_children, {"parent_id": str(parent_id)})
+        return [_category_from_row(row) for row in rows]
 
     def get_system_category(self, user_id: UserId, name: str) -> Category | None:
         """Get a system category by name.
@@ -116,13 +136,14 @@ class SqlAlchemyCategoryRepository:
         """
         stmt = (
             select(Category)
+            .options(*_load_options)
             .where(
-                Category.user_id == str(user_id)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
+                Category.user_id == bindparam("user_id")  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
             )
             .where(Category.is_system == True)  # type: ignore[arg-type]  # noqa: E712  # SQLAlchemy imperative mapping
-            .where(Category.name == name)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
+            .where(Category.name == bindparam("name"))  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
         )
-        category = self._session.scalar(stmt)
+        category = self._session.scalar(stmt, {"user_id": str(user_id), "name": name})
         if category is not None:
             self._reconstruct_value_objects(category)
         return category
@@ -139,14 +160,18 @@ class SqlAlchemyCategoryRepository:
         Returns:
             The 'Uncategorized' category for the user.
         """
-        existing = self.get_system_category(user_id, SYSTEM_CATEGORY_UNCATEGORIZED)
-        if existing:
-            return existing
+        cached = self._uncategorized.get(user_id)
+        if cached is not None:
+            return cached
+
+        category = self.get_system_category(user_id, SYSTEM_CATEGORY_UNCATEGORIZED)
+        if category is None:
+            category = Category.create_system_category(
+                user_id, SYSTEM_CATEGORY_UNCATEGORIZED, household_id=household_id
+            )
+            self._session.add(category)
 
-        category = Category.create_system_category(
-            user_id, SYSTEM_CATEGORY_UNCATEGORIZED, household_id=household_id
-        )
-        self._session.add(category)
+        self._uncategorized[user_id] = category
         return category
 
     def update(self, category: Category) -> None:
@@ -167,14 +192,15 @@ class SqlAlchemyCategoryRepository:
         Args:
             category_id: The category identifier to delete.
         """
-        category = self.get(category_id)
-        if category:
+        # Load without value object reconstruction - it's only being deleted
+        category = self._session.get(Category, category_id)
+        if category is not None:
             self._session.delete(category)
 
     def count_transactions(self, category_id: CategoryId) -> int:
         """Count transactions using this category.
 
-        Used for deletion validation - prevents deleting categories in use.
+        Prefer has_transactions() when only existence matters.
 
         Args:
             category_id: The category identifier.
@@ -189,49 +215,34 @@ class SqlAlchemyCategoryRepository:
         )
         return self._session.scalar(stmt) or 0
 
-    def _reconstruct_value_objects(self, category: Category) -> None:
-        """Reconstruct value objects from database primitives.
+    def has_transactions(self, category_id: CategoryId) -> bool:
+        """Check if any transactions use this category.
+
+        Used for deletion validation - prevents deleting categories in use.
+        EXISTS stops at the first matching split line instead of counting all.
 
         Args:
-            category: Category entity loaded from database.
+            category_id: The category identifier.
+
+        Returns:
+            True if at least one split line references this category.
         """
-        # Reconstruct CategoryId from string
-        if isinstance(category.id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(category, "id", CategoryId.from_string(category.id))  # type: ignore[arg-type]  # str at runtime from DB
-
-        # Reconstruct UserId from string
-        if isinstance(category.user_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(
-                category,
-                "user_id",
-                UserId.from_string(category.user_id),  # type: ignore[arg-type]  # str at runtime from DB
-            )
+        stmt = select(exists().where(split_lines.c.category_id == str(category_id)))
+        return bool(self._session.scalar(stmt))
 
-        # Reconstruct HouseholdId from string
-        if hasattr(category, "household_id") and isinstance(category.household_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(
-                category,
-                "household_id",
-                HouseholdId.from_string(category.household_id),  # type: ignore[arg-type]  # str at runtime from DB
-            )
+    def _reconstruct_value_objects(self, category: Category) -> None:
+        """Reconstruct value objects from database primitives.
 
-        # Reconstruct parent_id CategoryId from string
-        if category.parent_id is not None and isinstance(category.parent_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(
-                category,
-                "parent_id",
-                CategoryId.from_string(category.parent_id),  # type: ignore[arg-type]  # str at runtime from DB
-            )
+        Ids already load as value objects via their column types; only the
+        category_type string and the transient _events list remain.
 
-        # Reconstruct CategoryType enum from string
-        if isinstance(category.category_type, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(
-                category, "category_type", CategoryType(category.category_type)
-            )
+        Args:
+            category: Category entity loaded from database.
+        """
+        category_type = category.category_type
+        if type(category_type) is str:
+            object.__setattr__(category, "category_type", CategoryType(category_type))
 
         # Ensure _events list exists (transient field, not loaded from DB)
-        if (
-            not hasattr(category, "_events")
-            or getattr(category, "_events", None) is None
-        ):
+        if getattr(category, "_events", None) is None:
             object.__setattr__(category, "_events", [])
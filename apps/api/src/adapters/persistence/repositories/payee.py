@@ -8,11 +8,51 @@ types. The type: ignore comments on .where() and .order_by() clauses are
 expected and correct.
 """
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from typing import Any
 
-from domain.model.entity_id import CategoryId, HouseholdId, PayeeId, UserId
+from sqlalchemy import Row, bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, raiseload
+
+from domain.model.entity_id import HouseholdId, PayeeId, UserId
 from domain.model.payee import Payee
+from src.adapters.persistence.orm.base import STRICT_LOADING
+from src.adapters.persistence.orm.tables import payees
+
+# Loader options for ORM reads (see STRICT_LOADING)
+_load_options = (raiseload("*"),) if STRICT_LOADING else ()
+
+# Core selects for read-only list queries (bypass ORM identity map/loading)
+_select_by_user = (
+    select(payees)
+    .where(payees.c.user_id == bindparam("user_id"))
+    .order_by(payees.c.usage_count.desc(), payees.c.name)
+)
+_LIKE_ESCAPES = str.maketrans({"/": "//", "%": "/%", "_": "/_"})
+_select_search = (
+    select(payees)
+    .where(payees.c.user_id == bindparam("user_id"))
+    # Plain LIKE 'prefix%' so the text_pattern_ops index serves the range scan
+    .where(payees.c.normalized_name.like(bindparam("pattern"), escape="/"))
+    .order_by(payees.c.usage_count.desc(), payees.c.name)
+    .limit(bindparam("limit"))
+)
+
+
+def _payee_from_row(row: Row[Any]) -> Payee:
+    """Build a detached Payee from a payees table row."""
+    return Payee(
+        id=row.id,
+        user_id=row.user_id,
+        household_id=row.household_id,
+        name=row.name,
+        normalized_name=row.normalized_name,
+        default_category_id=row.default_category_id,
+        last_used_at=row.last_used_at,
+        usage_count=row.usage_count,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
 
 
 class SqlAlchemyPayeeRepository:
@@ -46,37 +86,22 @@ class SqlAlchemyPayeeRepository:
         Returns:
             Payee entity or None if not found.
         """
-        payee = self._session.get(Payee, str(payee_id))
-        if payee is not None:
-            self._reconstruct_value_objects(payee)
-        return payee
+        return self._session.get(Payee, payee_id)
 
     def get_by_user(self, user_id: UserId) -> list[Payee]:
         """Get all payees for a user.
 
+        Read-only list path: rows are fetched through Core and returned as
+        detached entities. Use get() to load a payee for modification.
+
         Args:
             user_id: The user identifier.
 
         Returns:
             List of Payee entities ordered by usage count (descending) and name.
         """
-        stmt = (
-            select(Payee)
-            .where(
-                Payee.user_id == str(user_id)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping: domain attr becomes Column at runtime
-            )
-            .order_by(
-                Payee.usage_count.desc(),  # type: ignore[union-attr]  # SQLAlchemy imperative mapping: .desc() available at runtime
-                Payee.name,  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
-            )
-        )
-        result = self._session.execute(stmt)
-        payees = list(result.scalars().all())
-
-        for payee in payees:
-            self._reconstruct_value_objects(payee)
-
-        return payees
+        rows = self._session.execute(_select_by_user, {"user_id": str(user_id)})
+        return [_payee_from_row(row) for row in rows]
 
     def find_by_name(self, user_id: UserId, name: str) -> Payee | None:
         """Find payee by normalized name (case-insensitive).
@@ -91,17 +116,17 @@ class SqlAlchemyPayeeRepository:
         normalized = name.strip().lower()
         stmt = (
             select(Payee)
+            .options(*_load_options)
             .where(
-                Payee.user_id == str(user_id)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
+                Payee.user_id == bindparam("user_id")  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
             )
             .where(
-                Payee.normalized_name == normalized  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
+                Payee.normalized_name == bindparam("normalized_name")  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
             )
         )
-        payee = self._session.scalar(stmt)
-        if payee is not None:
-            self._reconstruct_value_objects(payee)
-        return payee
+        return self._session.scalar(
+            stmt, {"user_id": str(user_id), "normalized_name": normalized}
+        )
 
     def search(
         self,
@@ -112,6 +137,8 @@ class SqlAlchemyPayeeRepository:
         """Search payees by name prefix for autocomplete.
 
         Results are sorted by usage count (descending) for relevance.
+        An empty query returns no results rather than every payee.
+        Read-only list path, see get_by_user().
 
         Args:
             user_id: The user identifier.
@@ -122,27 +149,15 @@ class SqlAlchemyPayeeRepository:
             List of matching Payee entities.
         """
         normalized_query = query.strip().lower()
-        stmt = (
-            select(Payee)
-            .where(
-                Payee.user_id == str(user_id)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
-            )
-            .where(
-                Payee.normalized_name.startswith(normalized_query)  # type: ignore[union-attr]  # SQLAlchemy imperative mapping: .startswith() available at runtime
-            )
-            .order_by(
-                Payee.usage_count.desc(),  # type: ignore[union-attr]  # SQLAlchemy imperative mapping: .desc() available at runtime
-                Payee.name,  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
-            )
-            .limit(limit)
+        if not normalized_query:
+            return []
+        # Escape LIKE wildcards typed by the user so they match literally
+        pattern = normalized_query.translate(_LIKE_ESCAPES) + "%"
+        rows = self._session.execute(
+            _select_search,
+            {"user_id": str(user_id), "pattern": pattern, "limit": limit},
         )
-        result = self._session.execute(stmt)
-        payees = list(result.scalars().all())
-
-        for payee in payees:
-            self._reconstruct_value_objects(payee)
-
-        return payees
+        return [_payee_from_row(row) for row in rows]
 
     def get_or_create(
         self, user_id: UserId, name: str, household_id: HouseholdId | None = None
@@ -151,6 +166,10 @@ class SqlAlchemyPayeeRepository:
 
         Used for auto-creation pattern when entering transactions.
 
+        Issues a single INSERT ... ON CONFLICT (user_id, normalized_name)
+        DO UPDATE ... RETURNING, so both the existing and the new case take
+        one round trip and concurrent creates cannot race on the unique index.
+
         Args:
             user_id: The user identifier.
             name: The payee name.
@@ -159,13 +178,29 @@ class SqlAlchemyPayeeRepository:
         Returns:
             Existing or newly created Payee entity.
         """
-        existing = self.find_by_name(user_id, name)
-        if existing:
-            return existing
-
-        payee = Payee.create(user_id=user_id, name=name, household_id=household_id)
-        self._session.add(payee)
-        return payee
+        candidate = Payee.create(user_id=user_id, name=name, household_id=household_id)
+        stmt = (
+            pg_insert(Payee)
+            .values(
+                id=candidate.id,
+                user_id=candidate.user_id,
+                household_id=candidate.household_id,
+                name=candidate.name,
+                normalized_name=candidate.normalized_name,
+                usage_count=candidate.usage_count,
+                created_at=candidate.created_at,
+                updated_at=candidate.updated_at,
+            )
+            .on_conflict_do_update(
+                index_elements=[payees.c.user_id, payees.c.normalized_name],
+                # No-op update so RETURNING yields the existing row on conflict
+                set_={"normalized_name": payees.c.normalized_name},
+            )
+            .returning(Payee)
+        )
+        return self._session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
 
     def update(self, payee: Payee) -> None:
         """Update an existing payee.
@@ -185,38 +220,6 @@ class SqlAlchemyPayeeRepository:
         Args:
             payee_id: The payee identifier to delete.
         """
-        payee = self.get(payee_id)
-        if payee:
+        payee = self._session.get(Payee, payee_id)
+        if payee is not None:
             self._session.delete(payee)
-
-    def _reconstruct_value_objects(self, payee: Payee) -> None:
-        """Reconstruct value objects from database primitives.
-
-        Args:
-            payee: Payee entity loaded from database.
-        """
-        # Reconstruct PayeeId from string
-        if isinstance(payee.id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(payee, "id", PayeeId.from_string(payee.id))  # type: ignore[arg-type]  # str at runtime from DB
-
-        # Reconstruct UserId from string
-        if isinstance(payee.user_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(payee, "user_id", UserId.from_string(payee.user_id))  # type: ignore[arg-type]  # str at runtime from DB
-
-        # Reconstruct HouseholdId from string
-        if hasattr(payee, "household_id") and isinstance(payee.household_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(
-                payee,
-                "household_id",
-                HouseholdId.from_string(payee.household_id),  # type: ignore[arg-type]  # str at runtime from DB
-            )
-
-        # Reconstruct default_category_id CategoryId from string
-        if payee.default_category_id is not None and isinstance(
-            payee.default_category_id, str
-        ):
-            object.__setattr__(
-                payee,
-                "default_category_id",
-                CategoryId.from_string(payee.default_category_id),
-            )
@@ -22,8 +22,8 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy import and_, delete, select, update
 from sqlalchemy.orm import Session
 
-from domain.model.entity_id import UserId
-from src.adapters.persistence.orm.tables import refresh_tokens
+from domain.model.entity_id import HouseholdId, UserId
+from src.adapters.persistence.orm.tables import refresh_tokens, users
 
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
@@ -140,66 +140,92 @@ class RefreshTokenRepository:
 
     def validate_and_rotate(
         self, raw_token: str
-    ) -> tuple[str, RefreshTokenRecord] | None:
+    ) -> tuple[str, RefreshTokenRecord, HouseholdId] | None:
         """Validate a refresh token and rotate it (issue new token, revoke old).
 
-        Looks up the token by its SHA-256 hash. If found, checks:
-        1. Token is not revoked (revoked_at IS NULL)
-        2. Token is not expired (expires_at > now)
+        The token is validated and revoked by a single UPDATE that only
+        matches an active (not revoked, not expired) token, joined to its
+        user so the household_id needed for the access token comes back
+        in the same round trip. Because the match and the revocation are
+        one statement, two concurrent refreshes with the same token can't
+        both succeed: the loser sees it as reuse.
 
         If the token is revoked (reuse detected), revokes the ENTIRE family
-        as a security measure (potential token theft).
+        as a security measure (potential token theft). That revocation is
+        only durable once the caller commits, so callers must commit even
+        when None is returned.
 
-        If valid, revokes the old token and creates a new one in the same family.
+        If valid, a new token is created in the same family.
 
         Args:
             raw_token: The raw token value from the client cookie.
 
         Returns:
-            Tuple of (new_raw_token, new_record) on success, or None if invalid.
-
-        SQL for lookup:
-            SELECT * FROM refresh_tokens WHERE token_hash = :hash
-
-        SQL for revoke old:
-            UPDATE refresh_tokens SET revoked_at = :now WHERE id = :id
+            Tuple of (new_raw_token, new_record, household_id) on success,
+            or None if invalid.
+
+        SQL for validate + revoke old:
+            UPDATE refresh_tokens SET revoked_at = :now FROM users
+            WHERE refresh_tokens.token_hash = :hash
+              AND refresh_tokens.revoked_at IS NULL
+              AND refresh_tokens.expires_at > :now
+              AND users.id = refresh_tokens.user_id
+            RETURNING refresh_tokens.user_id, refresh_tokens.token_family,
+                      users.household_id
 
         SQL for family revocation (on reuse):
             UPDATE refresh_tokens SET revoked_at = :now
-            WHERE token_family = :family AND revoked_at IS NULL
+            WHERE token_family IN (
+                SELECT token_family FROM refresh_tokens
+                WHERE token_hash = :hash AND revoked_at IS NOT NULL
+            ) AND revoked_at IS NULL
         """
         token_hash = _hash_token(raw_token)
         now = datetime.now(UTC)
 
-        # Look up token by hash
+        # Revoke the token only if it is currently active
         result = self._session.execute(
-            select(refresh_tokens).where(refresh_tokens.c.token_hash == token_hash)
+            update(refresh_tokens)
+            .where(
+                refresh_tokens.c.token_hash == token_hash,
+                refresh_tokens.c.revoked_at.is_(None),
+                refresh_tokens.c.expires_at > now,
+                users.c.id == refresh_tokens.c.user_id,
+            )
+            .values(revoked_at=now)
+            .returning(
+                refresh_tokens.c.user_id,
+                refresh_tokens.c.token_family,
+                users.c.household_id,
+            )
         )
-        row = result.mappings().first()
+        row = result.first()
         if row is None:
+            # Unknown, expired, or already revoked. Only the last is reuse,
+            # in which case the entire family is revoked.
+            self._session.execute(
+                update(refresh_tokens)
+                .where(
+                    refresh_tokens.c.token_family.in_(
+                        select(refresh_tokens.c.token_family).where(
+                            refresh_tokens.c.token_hash == token_hash,
+                            refresh_tokens.c.revoked_at.is_not(None),
+                        )
+                    ),
+                    refresh_tokens.c.revoked_at.is_(None),
+                )
+                .values(revoked_at=now)
+            )
             return None
 
-        # If already revoked -> reuse detected, revoke entire family
-        if row["revoked_at"] is not None:
-            self.revoke_family(row["token_family"])
-            return None
-
-        # If expired -> return None
-        if row["expires_at"] <= now:
-            return None
-
-        # Revoke old token
-        self._session.execute(
-            update(refresh_tokens)
-            .where(refresh_tokens.c.id == row["id"])
-            .values(revoked_at=now)
-        )
+        user_id, token_family, household_id = row.tuple()
 
         # Create new token in same family
-        return self.create_token(
-            UserId.from_string(row["user_id"]),
-            family=row["token_family"],
+        new_raw_token, record = self.create_token(
+            user_id,  # UserIdType loads UserId
+            family=token_family,
         )
+        return new_raw_token, record, household_id
 
     def revoke_all_for_user(self, user_id: UserId) -> int:
         """Revoke all active refresh tokens for a user (logout all sessions).
@@ -19,9 +19,6 @@ from sqlalchemy.orm import Session
 from domain.model.entity_id import (
     AccountId,
     CategoryId,
-    HouseholdId,
-    PayeeId,
-    SplitId,
     TransactionId,
     UserId,
 )
@@ -31,6 +28,12 @@ from domain.model.transaction import Transaction
 from domain.model.transaction_types import TransactionSource, TransactionStatus
 from src.adapters.persistence.orm.tables import split_lines, transactions
 
+# INSERT statements built once at import and reused for every write. Split
+# lines go through executemany(), which the engine batches into multi-row
+# INSERTs (see INSERTMANYVALUES_PAGE_SIZE in database.py).
+_insert_transaction = transactions.insert()
+_insert_split_lines = split_lines.insert()
+
 
 class SqlAlchemyTransactionRepository:
     """SQLAlchemy implementation of TransactionRepository.
@@ -64,28 +67,17 @@ class SqlAlchemyTransactionRepository:
         )
         rows = self._session.execute(stmt).fetchall()
 
-        result: list[SplitLine] = []
-        for row in rows:
-            amount = Money(row.amount, row.currency)
-            category_id = (
-                CategoryId.from_string(row.category_id) if row.category_id else None
-            )
-            transfer_account_id = (
-                AccountId.from_string(row.transfer_account_id)
-                if row.transfer_account_id
-                else None
-            )
-
-            # Load SplitId from database
-            split = SplitLine(
-                id=SplitId.from_string(row.split_id),
-                amount=amount,
-                category_id=category_id,
-                transfer_account_id=transfer_account_id,
+        # Id columns load as value objects via their TypeDecorators
+        return [
+            SplitLine(
+                id=row.split_id,
+                amount=Money(row.amount, row.currency),
+                category_id=row.category_id,
+                transfer_account_id=row.transfer_account_id,
                 memo=row.memo,
             )
-            result.append(split)
-        return result
+            for row in rows
+        ]
 
     def _save_splits(self, transaction: Transaction) -> None:
         """Save split lines for a transaction.
@@ -101,23 +93,32 @@ class SqlAlchemyTransactionRepository:
         )
         self._session.execute(delete_stmt)
 
-        # Insert new splits
-        for i, split in enumerate(transaction.splits):
-            insert_stmt = split_lines.insert().values(
-                split_id=str(split.id),
-                transaction_id=str(transaction.id),
-                amount=split.amount.amount,
-                currency=split.amount.currency,
-                category_id=str(split.category_id) if split.category_id else None,
-                transfer_account_id=(
-                    str(split.transfer_account_id)
-                    if split.transfer_account_id
-                    else None
-                ),
-                memo=split.memo,
-                sort_order=i,
-            )
-            self._session.execute(insert_stmt)
+        # Insert new splits in a single executemany batch
+        if not transaction.splits:
+            return
+        transaction_id = str(transaction.id)
+        self._session.execute(
+            _insert_split_lines,
+            [
+                {
+                    "split_id": str(split.id),
+                    "transaction_id": transaction_id,
+                    "amount": split.amount.amount,
+                    "currency": split.amount.currency,
+                    "category_id": (
+                        str(split.category_id) if split.category_id else None
+                    ),
+                    "transfer_account_id": (
+                        str(split.transfer_account_id)
+                        if split.transfer_account_id
+                        else None
+                    ),
+                    "memo": split.memo,
+                    "sort_order": i,
+                }
+                for i, split in enumerate(transaction.splits)
+            ],
+        )
 
     def _hydrate_transaction(self, txn: Transaction) -> Transaction:
         """Hydrate transaction with splits and Money amount.
@@ -128,7 +129,7 @@ class SqlAlchemyTransactionRepository:
         Returns:
             Fully hydrated Transaction with reconstructed value objects.
         """
-        # Reconstruct entity IDs
+        # Reconstruct enums
         self._reconstruct_value_objects(txn)
 
         # Load splits
@@ -147,52 +148,12 @@ class SqlAlchemyTransactionRepository:
     def _reconstruct_value_objects(self, txn: Transaction) -> None:
         """Reconstruct value objects from database primitives.
 
+        Ids already load as value objects via their column types; only the
+        enums and the transient _events list need restoring.
+
         Args:
             txn: Transaction entity loaded from database.
         """
-        # Reconstruct TransactionId from string
-        if isinstance(txn.id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(txn, "id", TransactionId.from_string(txn.id))  # type: ignore[arg-type]  # str at runtime from DB
-
-        # Reconstruct UserId from string
-        if isinstance(txn.user_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(txn, "user_id", UserId.from_string(txn.user_id))  # type: ignore[arg-type]  # str at runtime from DB
-
-        # Reconstruct HouseholdId from string
-        if hasattr(txn, "household_id") and isinstance(txn.household_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(
-                txn,
-                "household_id",
-                HouseholdId.from_string(txn.household_id),  # type: ignore[arg-type]  # str at runtime from DB
-            )
-
-        # Reconstruct AccountId from string
-        if isinstance(txn.account_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(txn, "account_id", AccountId.from_string(txn.account_id))  # type: ignore[arg-type]  # str at runtime from DB
-
-        # Reconstruct PayeeId from string
-        if txn.payee_id is not None and isinstance(txn.payee_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(txn, "payee_id", PayeeId.from_string(txn.payee_id))  # type: ignore[arg-type]  # str at runtime from DB
-
-        # Reconstruct source_transaction_id from string
-        if txn.source_transaction_id is not None and isinstance(
-            txn.source_transaction_id,
-            str,  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-        ):
-            object.__setattr__(
-                txn,
-                "source_transaction_id",
-                TransactionId.from_string(txn.source_transaction_id),  # type: ignore[arg-type]  # str at runtime from DB
-            )
-
-        # Reconstruct source_split_id from string
-        if txn.source_split_id is not None and isinstance(txn.source_split_id, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
-            object.__setattr__(
-                txn,
-                "source_split_id",
-                SplitId.from_string(txn.source_split_id),  # type: ignore[arg-type]  # str at runtime from DB
-            )
-
         # Reconstruct enums from string values
         if isinstance(txn.status, str):  # type: ignore[arg-type]  # SQLAlchemy loads str from DB
             object.__setattr__(txn, "status", TransactionStatus(txn.status))
@@ -225,36 +186,40 @@ class SqlAlchemyTransactionRepository:
             transaction: Transaction aggregate to persist.
         """
         # Insert the transaction using raw SQL (to include amount)
-        insert_stmt = transactions.insert().values(
-            id=str(transaction.id),
-            user_id=str(transaction.user_id),
-            household_id=str(transaction.household_id),
-            account_id=str(transaction.account_id),
-            effective_date=transaction.effective_date,
-            posted_date=transaction.posted_date,
-            amount=transaction.amount.amount,
-            currency=transaction.amount.currency,
-            status=transaction.status.value,
-            source=transaction.source.value,
-            payee_id=str(transaction.payee_id) if transaction.payee_id else None,
-            payee_name=transaction.payee_name,
-            memo=transaction.memo,
-            check_number=transaction.check_number,
-            source_transaction_id=(
-                str(transaction.source_transaction_id)
-                if transaction.source_transaction_id
-                else None
-            ),
-            source_split_id=(
-                str(transaction.source_split_id)
-                if transaction.source_split_id
-                else None
-            ),
-            is_mirror=transaction.is_mirror,
-            created_at=transaction.created_at,
-            updated_at=transaction.updated_at,
+        self._session.execute(
+            _insert_transaction,
+            {
+                "id": str(transaction.id),
+                "user_id": str(transaction.user_id),
+                "household_id": str(transaction.household_id),
+                "account_id": str(transaction.account_id),
+                "effective_date": transaction.effective_date,
+                "posted_date": transaction.posted_date,
+                "amount": transaction.amount.amount,
+                "currency": transaction.amount.currency,
+                "status": transaction.status.value,
+                "source": transaction.source.value,
+                "payee_id": (
+                    str(transaction.payee_id) if transaction.payee_id else None
+                ),
+                "payee_name": transaction.payee_name,
+                "memo": transaction.memo,
+                "check_number": transaction.check_number,
+                "source_transaction_id": (
+                    str(transaction.source_transaction_id)
+                    if transaction.source_transaction_id
+                    else None
+                ),
+                "source_split_id": (
+                    str(transaction.source_split_id)
+                    if transaction.source_split_id
+                    else None
+                ),
+                "is_mirror": transaction.is_mirror,
+                "created_at": transaction.created_at,
+                "updated_at": transaction.updated_at,
+            },
         )
-        self._session.execute(insert_stmt)
 
         # Save splits
         self._save_splits(transaction)
@@ -271,7 +236,7 @@ class SqlAlchemyTransactionRepository:
         Returns:
             Transaction aggregate or None if not found.
         """
-        txn = self._session.get(Transaction, str(transaction_id))
+        txn = self._session.get(Transaction, transaction_id)
         if txn:
             return self._hydrate_transaction(txn)
         return None
@@ -304,7 +269,7 @@ class SqlAlchemyTransactionRepository:
             .offset(offset)
         )
         result = self._session.execute(stmt)
-        txns = list(result.scalars().all())
+        txns = list(result.scalars())
         return [self._hydrate_transaction(t) for t in txns]
 
     def get_by_user(
@@ -335,7 +300,7 @@ class SqlAlchemyTransactionRepository:
             .offset(offset)
         )
         result = self._session.execute(stmt)
-        txns = list(result.scalars().all())
+        txns = list(result.scalars())
         return [self._hydrate_transaction(t) for t in txns]
 
     def get_mirrors_for_source(
@@ -354,7 +319,7 @@ class SqlAlchemyTransactionRepository:
             Transaction.source_transaction_id == str(source_transaction_id)  # type: ignore[arg-type]  # SQLAlchemy imperative mapping
         )
         result = self._session.execute(stmt)
-        txns = list(result.scalars().all())
+        txns = list(result.scalars())
         return [self._hydrate_transaction(t) for t in txns]
 
     def search(
@@ -389,7 +354,7 @@ class SqlAlchemyTransactionRepository:
             .offset(offset)
         )
         result = self._session.execute(stmt)
-        txns = list(result.scalars().all())
+        txns = list(result.scalars())
         return [self._hydrate_transaction(t) for t in txns]
 
     def filter(
@@ -463,7 +428,7 @@ class SqlAlchemyTransactionRepository:
             )
 
         result = self._session.execute(stmt)
-        txns = list(result.scalars().all())
+        txns = list(result.scalars())
         return [self._hydrate_transaction(t) for t in txns]
 
     def count_by_account(self, account_id: AccountId) -> int:
@@ -523,7 +488,7 @@ class SqlAlchemyTransactionRepository:
             transaction_id: The transaction identifier to delete.
         """
         # Expunge any loaded transaction from session to prevent StaleDataError
-        txn = self._session.get(Transaction, str(transaction_id))
+        txn = self._session.get(Transaction, transaction_id)
         if txn:
             self._session.expunge(txn)
 
@@ -7,6 +7,7 @@ User entity for persistence via imperative mapping.
 from sqlalchemy.orm import Session
 
 from domain.model.entity_id import UserId
+from domain.model.household import Household
 from domain.model.user import User
 
 
@@ -54,6 +55,32 @@ class UserRepository:
             self._ensure_events_list(user)
         return user
 
+    def get_with_household(self, user_id: UserId) -> tuple[User, Household] | None:
+        """Get user and their household in one JOINed query.
+
+        Args:
+            user_id: The user identifier.
+
+        Returns:
+            Tuple of (User, Household), or None if the user is not found.
+        """
+        row = (
+            self._session.query(User, Household)
+            .join(
+                Household,
+                Household.id == User.household_id,  # type: ignore[arg-type]  # SQLAlchemy imperative mapping: domain attr becomes Column at runtime
+            )
+            .filter(
+                User.id == user_id  # type: ignore[arg-type]  # SQLAlchemy imperative mapping: domain attr becomes Column at runtime
+            )
+            .first()
+        )
+        if row is None:
+            return None
+        user, household = row
+        self._ensure_events_list(user)
+        return (user, household)
+
     def get_by_email(self, email: str) -> User | None:
         """Get user by email address, or None if not found.
 
@@ -11,25 +11,52 @@ This implements the UnitOfWork protocol from src/domain/ports/unit_of_work.py.
 
 from __future__ import annotations
 
+import csv
+import io
 import json
-from typing import TYPE_CHECKING, Self
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Self
 
-from sqlalchemy import insert
+from src.application import event_bus
 
 from .orm.tables import outbox
+from .repositories.account import SqlAlchemyAccountRepository
+from .repositories.category import SqlAlchemyCategoryRepository
+from .repositories.household import HouseholdRepository
+from .repositories.payee import SqlAlchemyPayeeRepository
+from .repositories.refresh_token import RefreshTokenRepository
+from .repositories.transaction import SqlAlchemyTransactionRepository
+from .repositories.user import UserRepository
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
     from sqlalchemy.orm import Session, sessionmaker
 
     from domain.events.base import DomainEvent
 
-    from .repositories.account import SqlAlchemyAccountRepository
-    from .repositories.category import SqlAlchemyCategoryRepository
-    from .repositories.household import HouseholdRepository
-    from .repositories.payee import SqlAlchemyPayeeRepository
-    from .repositories.refresh_token import RefreshTokenRepository
-    from .repositories.transaction import SqlAlchemyTransactionRepository
-    from .repositories.user import UserRepository
+# Compiled once and reused; executemany batches rows via insertmanyvalues
+_insert_outbox = outbox.insert()
+
+# At or above this many outbox rows (bulk imports, replays), stream them
+# with COPY instead of multi-row INSERTs
+OUTBOX_COPY_THRESHOLD = 1000
+
+_COPY_OUTBOX_SQL = (
+    "COPY outbox (event_type, aggregate_type, aggregate_id, payload) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+# Repository accessor name -> repository class, created lazily per session
+_REPOSITORIES: dict[str, type] = {
+    "accounts": SqlAlchemyAccountRepository,
+    "categories": SqlAlchemyCategoryRepository,
+    "households": HouseholdRepository,
+    "payees": SqlAlchemyPayeeRepository,
+    "refresh_tokens": RefreshTokenRepository,
+    "transactions": SqlAlchemyTransactionRepository,
+    "users": UserRepository,
+}
 
 
 class SqlAlchemyUnitOfWork:
@@ -46,16 +73,17 @@ class SqlAlchemyUnitOfWork:
             uow.collect_events(account.events)
             await uow.commit()  # Events written to outbox here
 
-    Repositories are lazily created on first access via properties.
+    Repositories are lazily created on first access via __getattr__.
     """
 
-    _accounts: SqlAlchemyAccountRepository | None
-    _categories: SqlAlchemyCategoryRepository | None
-    _households: HouseholdRepository | None
-    _payees: SqlAlchemyPayeeRepository | None
-    _refresh_tokens: RefreshTokenRepository | None
-    _transactions: SqlAlchemyTransactionRepository | None
-    _users: UserRepository | None
+    # Repository accessors, resolved by __getattr__ from _REPOSITORIES
+    accounts: SqlAlchemyAccountRepository
+    categories: SqlAlchemyCategoryRepository
+    households: HouseholdRepository
+    payees: SqlAlchemyPayeeRepository
+    refresh_tokens: RefreshTokenRepository
+    transactions: SqlAlchemyTransactionRepository
+    users: UserRepository
 
     def __init__(self, session_factory: sessionmaker[Session]) -> None:
         """Initialize Unit of Work.
@@ -66,13 +94,6 @@ class SqlAlchemyUnitOfWork:
         self._session_factory = session_factory
         self._events: list[DomainEvent] = []
         self._session: Session | None = None
-        self._accounts: SqlAlchemyAccountRepository | None = None
-        self._categories: SqlAlchemyCategoryRepository | None = None
-        self._households: HouseholdRepository | None = None
-        self._payees: SqlAlchemyPayeeRepository | None = None
-        self._refresh_tokens: RefreshTokenRepository | None = None
-        self._transactions: SqlAlchemyTransactionRepository | None = None
-        self._users: UserRepository | None = None
 
     def __enter__(self) -> Self:
         """Start a new unit of work (transaction).
@@ -82,13 +103,8 @@ class SqlAlchemyUnitOfWork:
         """
         self._session = self._session_factory()
         # Reset repository instances for fresh session
-        self._accounts = None
-        self._categories = None
-        self._households = None
-        self._payees = None
-        self._refresh_tokens = None
-        self._transactions = None
-        self._users = None
+        for name in _REPOSITORIES:
+            self.__dict__.pop(name, None)
         return self
 
     def __exit__(
@@ -106,6 +122,21 @@ class SqlAlchemyUnitOfWork:
         if self._session:
             self._session.close()
 
+    @contextmanager
+    def readonly(self) -> Generator[Self, None, None]:
+        """Unit of work for queries only.
+
+        The session's connection runs in AUTOCOMMIT mode, so listing and
+        lookup endpoints skip the BEGIN and the ROLLBACK issued on close.
+        Nothing may be written or committed inside the block.
+
+        Yields:
+            Self for use in with statement.
+        """
+        with self:
+            self.session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+            yield self
+
     @property
     def session(self) -> Session:
         """Access to underlying session for repositories.
@@ -120,119 +151,33 @@ class SqlAlchemyUnitOfWork:
             raise RuntimeError("UnitOfWork must be used as context manager")
         return self._session
 
-    @property
-    def accounts(self) -> SqlAlchemyAccountRepository:
-        """Access to Account repository.
-
-        Lazily creates repository on first access.
-
-        Returns:
-            SqlAlchemyAccountRepository for account persistence.
-        """
-        if self._accounts is None:
-            from .repositories.account import SqlAlchemyAccountRepository
-
-            self._accounts = SqlAlchemyAccountRepository(self.session)
-        return self._accounts
+    def __getattr__(self, name: str) -> Any:
+        """Lazily create a repository on first access.
 
-    @property
-    def categories(self) -> SqlAlchemyCategoryRepository:
-        """Access to Category repository.
-
-        Lazily creates repository on first access.
-
-        Returns:
-            SqlAlchemyCategoryRepository for category persistence.
-        """
-        if self._categories is None:
-            from .repositories.category import SqlAlchemyCategoryRepository
-
-            self._categories = SqlAlchemyCategoryRepository(self.session)
-        return self._categories
-
-    @property
-    def payees(self) -> SqlAlchemyPayeeRepository:
-        """Access to Payee repository.
-
-        Lazily creates repository on first access.
-
-        Returns:
-            SqlAlchemyPayeeRepository for payee persistence.
-        """
-        if self._payees is None:
-            from .repositories.payee import SqlAlchemyPayeeRepository
-
-            self._payees = SqlAlchemyPayeeRepository(self.session)
-        return self._payees
-
-    @property
-    def transactions(self) -> SqlAlchemyTransactionRepository:
-        """Access to Transaction repository.
+        The instance is stored on the unit of work, so later accesses are
+        plain attribute lookups and no longer reach __getattr__.
 
-        Lazily creates repository on first access.
-
-        Returns:
-            SqlAlchemyTransactionRepository for transaction persistence.
-        """
-        if self._transactions is None:
-            from .repositories.transaction import SqlAlchemyTransactionRepository
-
-            self._transactions = SqlAlchemyTransactionRepository(self.session)
-        return self._transactions
-
-    @property
-    def users(self) -> UserRepository:
-        """Access to User repository.
-
-        Lazily creates repository on first access.
-
-        Returns:
-            UserRepository for user persistence.
-        """
-        if self._users is None:
-            from .repositories.user import UserRepository
-
-            self._users = UserRepository(self.session)
-        return self._users
-
-    @property
-    def households(self) -> HouseholdRepository:
-        """Access to Household repository.
-
-        Lazily creates repository on first access.
-
-        Returns:
-            HouseholdRepository for household persistence.
-        """
-        if self._households is None:
-            from .repositories.household import HouseholdRepository
-
-            self._households = HouseholdRepository(self.session)
-        return self._households
-
-    @property
-    def refresh_tokens(self) -> RefreshTokenRepository:
-        """Access to RefreshToken repository.
-
-        Lazily creates repository on first access.
-
-        Returns:
-            RefreshTokenRepository for refresh token persistence.
+        Raises:
+            AttributeError: If name is not a known repository accessor.
         """
-        if self._refresh_tokens is None:
-            from .repositories.refresh_token import RefreshTokenRepository
-
-            self._refresh_tokens = RefreshTokenRepository(self.session)
-        return self._refresh_tokens
-
-    def collect_events(self, events: list[DomainEvent]) -> None:
+        repository_cls = _REPOSITORIES.get(name)
+        if repository_cls is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        repository = repository_cls(self.session)
+        setattr(self, name, repository)
+        return repository
+
+    def collect_events(self, events: Iterable[DomainEvent]) -> None:
         """Collect domain events to be persisted with commit.
 
         Events are not written until commit() is called, ensuring
         they are part of the same transaction as business data.
 
         Args:
-            events: List of domain events to persist.
+            events: Domain events to persist; any iterable is consumed
+                directly into the pending list.
         """
         self._events.extend(events)
 
@@ -250,29 +195,62 @@ class SqlAlchemyUnitOfWork:
         CRITICAL: Events are published AFTER commit succeeds to ensure
         handlers see committed data (see 05-RESEARCH.md Pitfall 1).
         """
-        # Capture events before commit clears them
-        events_to_publish = list(self._events)
-
-        # Write collected events to outbox
-        for event in self._events:
-            # Only write events that conform to DomainEvent protocol
-            if hasattr(event, "event_type") and hasattr(event, "aggregate_type"):
-                self.session.execute(
-                    insert(outbox).values(
-                        event_type=event.event_type,
-                        aggregate_type=event.aggregate_type,
-                        aggregate_id=event.aggregate_id,
-                        payload=json.dumps(event.to_dict(), default=str),
-                    )
-                )
+        if not self._events:
+            self.session.commit()
+            return
+
+        events = self._events
+
+        # Write collected events to outbox in a single executemany
+        # Only write events that conform to DomainEvent protocol
+        rows = [
+            {
+                "event_type": event.event_type,
+                "aggregate_type": event.aggregate_type,
+                "aggregate_id": event.aggregate_id,
+                "payload": event.to_dict(),  # JSONB, encoded by the driver
+            }
+            for event in events
+            if hasattr(event, "event_type") and hasattr(event, "aggregate_type")
+        ]
+        if len(rows) >= OUTBOX_COPY_THRESHOLD:
+            self._copy_outbox(rows)
+        elif rows:
+            self.session.execute(_insert_outbox, rows)
         self.session.commit()
-        self._events.clear()
+        # Hand the list to publishing and start a fresh one (no copy needed)
+        self._events = []
 
         # Publish events to handlers AFTER commit succeeds
-        # Import inside method to avoid circular import issues
-        from src.application.event_bus import publish_all
+        await event_bus.publish_all(events)
+
+    def _copy_outbox(self, rows: list[dict[str, Any]]) -> None:
+        """Write outbox rows with COPY on the session's own connection.
 
-        await publish_all(events_to_publish)
+        Runs inside the current transaction, so the rows commit or roll
+        back with the business data exactly like the INSERT path.
+        Supports psycopg2 (copy_expert) and psycopg 3 (cursor.copy).
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            (
+                row["event_type"],
+                row["aggregate_type"],
+                row["aggregate_id"],
+                json.dumps(row["payload"], separators=(",", ":")),
+            )
+            for row in rows
+        )
+        buffer.seek(0)
+
+        # Raw driver connection (psycopg2 or psycopg 3); COPY has no DBAPI API
+        dbapi_connection: Any = self.session.connection().connection.driver_connection
+        with dbapi_connection.cursor() as cursor:
+            if hasattr(cursor, "copy_expert"):
+                cursor.copy_expert(_COPY_OUTBOX_SQL, buffer)
+            else:
+                with cursor.copy(_COPY_OUTBOX_SQL) as copy:
+                    copy.write(buffer.getvalue())
 
     def flush(self) -> None:
         """Flush pending changes to database without committing.
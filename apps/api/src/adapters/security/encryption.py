@@ -1,10 +1,43 @@
-"""Field-level AES-256-GCM encryption for sensitive data."""
+"""Field-level AES-256-GCM encryption for sensitive data.
+
+On CPUs without AES instructions, new values are encrypted with
+ChaCha20-Poly1305 instead, which is much faster than software AES. Those
+values carry a text prefix outside the base64 payload, so values written
+on any host can be decrypted on any other.
+"""
 
 import base64
+import binascii
 import os
+import threading
 from pathlib import Path
+from typing import ClassVar
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+
+# Marks ChaCha20-Poly1305 values; ":" is outside the base64 alphabet, so
+# unprefixed (AES-GCM) values written before the fallback existed still
+# decode unambiguously.
+_CHACHA_PREFIX = "c20p:"
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+def _has_aes_instructions() -> bool:
+    """Whether the CPU advertises hardware AES (x86 AES-NI, ARMv8 CE).
+
+    Reads the Linux /proc/cpuinfo flags ("flags" on x86, "Features" on ARM).
+    Assumes AES is available when this can't be determined.
+    """
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        return True
+    for line in cpuinfo.splitlines():
+        if line.startswith(("flags", "Features")):
+            return "aes" in line.partition(":")[2].split()
+    return True
+
+
+_AES_HARDWARE = _has_aes_instructions()
 
 
 class FieldEncryption:
@@ -17,12 +50,18 @@ class FieldEncryption:
         decrypted = encryptor.decrypt(encrypted)
     """
 
-    def __init__(self, key: bytes) -> None:
+    # Process-wide instance shared by request handlers (see default())
+    _default: ClassVar["FieldEncryption | None"] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, key: bytes, use_chacha: bool | None = None) -> None:
         """
         Initialize with 32-byte key for AES-256.
 
         Args:
             key: 32-byte encryption key
+            use_chacha: Encrypt new values with ChaCha20-Poly1305. Defaults
+                to True only when the CPU lacks AES instructions.
 
         Raises:
             ValueError: If key is not 32 bytes
@@ -30,6 +69,11 @@ class FieldEncryption:
         if len(key) != 32:
             raise ValueError("Key must be 32 bytes for AES-256")
         self._aesgcm = AESGCM(key)
+        self._chacha = ChaCha20Poly1305(key)
+        if use_chacha is None:
+            use_chacha = not _AES_HARDWARE
+        self._cipher = self._chacha if use_chacha else self._aesgcm
+        self._prefix = _CHACHA_PREFIX if use_chacha else ""
 
     @classmethod
     def generate_key(cls) -> bytes:
@@ -53,6 +97,10 @@ class FieldEncryption:
         """
         Load encryption key from Docker secret.
 
+        The secret should preferably hold the 32 raw key bytes, which are
+        used verbatim. Base64 text of the key (optionally newline
+        terminated) is also accepted.
+
         Args:
             secret_name: Name of the secret file
             secrets_dir: Directory where Docker mounts secrets
@@ -75,12 +123,42 @@ class FieldEncryption:
                 f"Secret not found at {secret_path} and ENCRYPTION_KEY env var not set"
             )
 
-        key = secret_path.read_bytes().strip()
-        # Key might be base64 encoded in the secret file
-        if len(key) == 44:  # Base64 encoded 32 bytes
-            key = base64.b64decode(key)
+        key = secret_path.read_bytes()
+        if len(key) != 32:
+            # Not raw bytes: text key, possibly base64, with a trailing newline
+            key = key.strip()
+            if len(key) != 32:
+                try:
+                    key = base64.b64decode(key, validate=True)
+                except binascii.Error as e:
+                    raise ValueError(
+                        f"Secret {secret_name} must contain 32 raw bytes "
+                        "or a base64-encoded 32-byte key"
+                    ) from e
         return cls(key)
 
+    @classmethod
+    def default(cls) -> "FieldEncryption":
+        """
+        Shared instance loaded once via from_docker_secret().
+
+        The key never changes for the life of the process, so requests
+        reuse one AESGCM instead of re-reading the secret and rebuilding
+        the cipher each time.
+
+        Returns:
+            FieldEncryption instance
+
+        Raises:
+            FileNotFoundError: If secret file doesn't exist
+            ValueError: If key is invalid
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls.from_docker_secret()
+        return cls._default
+
     @classmethod
     def from_env(cls) -> "FieldEncryption":
         """
@@ -110,9 +188,33 @@ class FieldEncryption:
             Base64-encoded nonce+ciphertext
         """
         nonce = os.urandom(12)  # 96-bit nonce for GCM
-        ciphertext = self._aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
+        ciphertext = self._cipher.encrypt(nonce, plaintext.encode("utf-8"), None)
         # Prepend nonce to ciphertext for storage
-        return base64.b64encode(nonce + ciphertext).decode("ascii")
+        return self._prefix + base64.b64encode(nonce + ciphertext).decode("ascii")
+
+    def encrypt_many(self, plaintexts: list[str]) -> list[str]:
+        """
+        Encrypt several strings, e.g. when importing many records.
+
+        Equivalent to calling encrypt() on each value, but all nonces come
+        from a single os.urandom() call.
+
+        Args:
+            plaintexts: Strings to encrypt
+
+        Returns:
+            Base64-encoded nonce+ciphertext for each input, in order
+        """
+        nonces = os.urandom(12 * len(plaintexts))
+        encrypt = self._cipher.encrypt
+        prefix = self._prefix
+        results: list[str] = []
+        for i, plaintext in enumerate(plaintexts):
+            nonce = nonces[i * 12 : i * 12 + 12]
+            ciphertext = encrypt(nonce, plaintext.encode("utf-8"), None)
+            encoded = base64.b64encode(nonce + ciphertext).decode("ascii")
+            results.append(prefix + encoded)
+        return results
 
     def decrypt(self, encrypted: str) -> str:
         """
@@ -127,8 +229,34 @@ class FieldEncryption:
         Raises:
             cryptography.exceptions.InvalidTag: If decryption fails
         """
-        data = base64.b64decode(encrypted)
+        cipher, data = self._unpack(encrypted)
         nonce = data[:12]
         ciphertext = data[12:]
-        plaintext = self._aesgcm.decrypt(nonce, ciphertext, None)
+        plaintext = cipher.decrypt(nonce, ciphertext, None)
         return plaintext.decode("utf-8")
+
+    def decrypt_many(self, encrypted: list[str]) -> list[str]:
+        """
+        Decrypt several strings produced by encrypt() or encrypt_many().
+
+        Args:
+            encrypted: Base64-encoded nonce+ciphertext values
+
+        Returns:
+            Original plaintexts, in order
+
+        Raises:
+            cryptography.exceptions.InvalidTag: If any decryption fails
+        """
+        unpack = self._unpack
+        results: list[str] = []
+        for value in encrypted:
+            cipher, data = unpack(value)
+            results.append(cipher.decrypt(data[:12], data[12:], None).decode("utf-8"))
+        return results
+
+    def _unpack(self, encrypted: str) -> tuple[AESGCM | ChaCha20Poly1305, bytes]:
+        """Pick the cipher a stored value was written with and decode it."""
+        if encrypted.startswith(_CHACHA_PREFIX):
+            return self._chacha, base64.b64decode(encrypted[len(_CHACHA_PREFIX) :])
+        return self._aesgcm, base64.b64decode(encrypted)
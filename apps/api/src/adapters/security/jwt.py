@@ -8,17 +8,27 @@ CRITICAL: Always specify algorithms explicitly to prevent algorithm confusion at
 """
 
 import os
-from datetime import UTC, datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any
 
 import jwt
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
+from jwt.types import Options
 
 # Configuration from environment
 JWT_SECRET = os.environ.get("JWT_SECRET", "CHANGE-ME-IN-PRODUCTION")
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 
+# Built once rather than per call: the HMAC key as bytes (PyJWT would
+# otherwise encode the str secret on every sign/verify), the allowed
+# algorithm list and the required-claims options. Shared module state, so
+# the algorithm list is an immutable tuple.
+_SIGNING_KEY = JWT_SECRET.encode("utf-8")
+_ALGORITHMS = (JWT_ALGORITHM,)  # CRITICAL: explicit algorithm list
+_DECODE_OPTIONS: Options = {"require": ["exp", "sub", "household_id"]}
+
 
 class TokenError(Exception):
     """Raised when token validation fails."""
@@ -48,8 +58,9 @@ def create_access_token(
     if expires_delta is None:
         expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    now = datetime.now(UTC)
-    expire = now + expires_delta
+    # Epoch seconds: PyJWT would otherwise convert datetimes itself
+    now = int(time.time())
+    expire = now + int(expires_delta.total_seconds())
 
     to_encode: dict[str, Any] = {
         "sub": user_id,
@@ -58,7 +69,7 @@ def create_access_token(
         "iat": now,
     }
 
-    return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=JWT_ALGORITHM)
 
 
 def decode_access_token(token: str) -> dict[str, Any]:
@@ -76,9 +87,9 @@ def decode_access_token(token: str) -> dict[str, Any]:
     try:
         payload: dict[str, Any] = jwt.decode(
             token,
-            JWT_SECRET,
-            algorithms=[JWT_ALGORITHM],  # CRITICAL: explicit algorithm list
-            options={"require": ["exp", "sub", "household_id"]},
+            _SIGNING_KEY,
+            algorithms=_ALGORITHMS,
+            options=_DECODE_OPTIONS,
         )
         return payload
     except ExpiredSignatureError as e:
@@ -4,13 +4,34 @@ Uses pwdlib with Argon2Hasher (winner of Password Hashing Competition).
 This module is infrastructure - domain layer does not depend on it.
 
 IMPORTANT: Do NOT use passlib (deprecated, breaks on Python 3.13+).
+
+The Argon2Hasher is backed by argon2-cffi, i.e. the C reference libargon2
+with its optimized (SSE2+) compression function, not a pure-Python build.
 """
 
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 
+# Argon2id cost parameters, pinned to the values existing hashes were
+# created with (argon2-cffi's defaults) so new PHC strings stay stable across
+# library upgrades. Login's dummy hash for unknown emails uses these too, so
+# lowering them would let response time reveal which accounts exist; any
+# change needs a rehash plan. Hashes with other parameters still verify,
+# since the PHC string carries its own.
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST_KIB = 65536
+ARGON2_PARALLELISM = 4
+
 # Create password hasher with Argon2 (recommended by FastAPI-Users, pwdlib docs)
-_password_hash = PasswordHash((Argon2Hasher(),))
+_password_hash = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=ARGON2_TIME_COST,
+            memory_cost=ARGON2_MEMORY_COST_KIB,
+            parallelism=ARGON2_PARALLELISM,
+        ),
+    )
+)
 
 
 def hash_password(plain_password: str) -> str:
@@ -5,7 +5,9 @@ time-limited tokens. No database lookup required - the token itself
 contains the email and is validated by signature + timestamp.
 """
 
+import hashlib
 import os
+from functools import partial
 
 from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 
@@ -14,6 +16,19 @@ TOKEN_SECRET = os.environ.get("JWT_SECRET", "CHANGE-ME-IN-PRODUCTION")
 EMAIL_VERIFICATION_SALT = "email-verification"
 EMAIL_VERIFICATION_MAX_AGE = 172800  # 48 hours in seconds
 
+# Tokens are signed with HMAC-BLAKE2b truncated to 16 bytes (faster than
+# the default SHA-1 and keeps links short). Tokens issued with the previous
+# SHA-1 signer still verify through the fallback until they expire.
+_SIGNER_DIGEST = partial(hashlib.blake2b, digest_size=16)
+
+# Secret and salt are fixed for the process, so build the serializer once
+_email_serializer = URLSafeTimedSerializer(
+    TOKEN_SECRET,
+    salt=EMAIL_VERIFICATION_SALT,
+    signer_kwargs={"digest_method": _SIGNER_DIGEST},
+    fallback_signers=[{"digest_method": hashlib.sha1}],
+)
+
 
 def generate_verification_token(email: str) -> str:
     """Generate a URL-safe verification token for email.
@@ -27,8 +42,7 @@ def generate_verification_token(email: str) -> str:
     Returns:
         URL-safe token string (can be used in links)
     """
-    serializer = URLSafeTimedSerializer(TOKEN_SECRET)
-    return serializer.dumps(email, salt=EMAIL_VERIFICATION_SALT)
+    return _email_serializer.dumps(email)
 
 
 def verify_email_token(
@@ -43,11 +57,8 @@ def verify_email_token(
     Returns:
         The email address if token is valid, None if invalid/expired
     """
-    serializer = URLSafeTimedSerializer(TOKEN_SECRET)
     try:
-        email: str = serializer.loads(
-            token, salt=EMAIL_VERIFICATION_SALT, max_age=max_age
-        )
+        email: str = _email_serializer.loads(token, max_age=max_age)
         return email
     except (SignatureExpired, BadSignature):
         return None
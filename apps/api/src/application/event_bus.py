@@ -3,7 +3,8 @@
 The event bus dispatches domain events to registered handlers after
 UoW commit. Handlers are called asynchronously. Both sync and async
 handlers are supported -- sync handlers are called directly, async
-handlers are awaited.
+handlers are awaited. An event's async handlers run concurrently, so
+they must not depend on each other's side effects.
 
 For async or potentially-failing operations (email, external API),
 handlers should enqueue jobs to the job queue.
@@ -22,6 +23,7 @@ Usage:
     await event_bus.publish_all(events)
 """
 
+import asyncio
 import inspect
 from collections.abc import Callable
 from typing import Any
@@ -30,25 +32,34 @@ from src.adapters.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Handler registry: event_type -> list of handler functions
-_handlers: dict[type, list[Callable[..., Any]]] = {}
+# Handler registry: event_type -> (event type name, registrations), where
+# each registration is (is_async, handler, handler name). Whether a handler
+# is a coroutine function, and the names used in log calls, are resolved
+# once at register() rather than on every dispatch.
+_Registration = tuple[bool, Callable[..., Any], str]
+_handlers: dict[type, tuple[str, list[_Registration]]] = {}
 
 
 def register(event_type: type, handler: Callable[..., Any]) -> None:
     """Register a handler for an event type.
 
-    Multiple handlers can be registered for the same event type.
-    Handlers are called in registration order. Both sync and async
-    handlers are supported.
+    Multiple handlers can be registered for the same event type. Both
+    sync and async handlers are supported: on publish, sync handlers run
+    inline in registration order, then the event's async handlers run
+    concurrently, so they must not depend on each other.
 
     Args:
         event_type: The type of event to handle (e.g., UserRegistered)
         handler: A callable (sync or async) that takes an event and handles it
     """
-    _handlers.setdefault(event_type, []).append(handler)
+    entry = _handlers.get(event_type)
+    if entry is None:
+        entry = _handlers[event_type] = (event_type.__name__, [])
+    is_async = inspect.iscoroutinefunction(handler)
+    entry[1].append((is_async, handler, handler.__name__))
     logger.debug(
         "handler_registered",
-        event_type=event_type.__name__,
+        event_type=entry[0],
         handler=handler.__name__,
     )
 
@@ -56,9 +67,10 @@ def register(event_type: type, handler: Callable[..., Any]) -> None:
 async def publish(event: Any) -> None:
     """Publish event to all registered handlers.
 
-    Supports both sync and async handlers. Async handlers are awaited,
-    sync handlers are called directly. This allows handlers to use
-    async operations like Procrastinate's defer_async().
+    Supports both sync and async handlers. Sync handlers are called
+    directly, in registration order. Async handlers are then awaited
+    together with asyncio.gather so their I/O overlaps. This allows
+    handlers to use async operations like Procrastinate's defer_async().
 
     If a handler raises an exception, it is logged and re-raised
     to fail fast during development. No PII is logged - only
@@ -68,27 +80,58 @@ async def publish(event: Any) -> None:
         event: The domain event to publish
     """
     event_type: type = type(event)  # type: ignore[reportUnknownMemberType]  # type(Any) returns type[Any], fine for handler registry lookup
-    handlers: list[Callable[..., Any]] = _handlers.get(event_type, [])
-
-    for handler in handlers:
+    entry = _handlers.get(event_type)
+    if entry is None:
+        return
+    event_name, registrations = entry
+
+    async_handlers: list[_Registration] = []
+    for registration in registrations:
+        is_async, handler, handler_name = registration
+        if is_async:
+            async_handlers.append(registration)
+            continue
         try:
-            logger.info(
+            logger.debug(
                 "handling_event",
-                event_type=event_type.__name__,
-                handler=handler.__name__,
+                event_type=event_name,
+                handler=handler_name,
             )
-            if inspect.iscoroutinefunction(handler):
-                await handler(event)
-            else:
-                handler(event)
+            handler(event)
         except Exception:
             logger.exception(
                 "handler_failed",
-                event_type=event_type.__name__,
-                handler=handler.__name__,
+                event_type=event_name,
+                handler=handler_name,
             )
             raise
 
+    if len(async_handlers) == 1:
+        await _call_async(async_handlers[0], event, event_name)
+    elif async_handlers:
+        await asyncio.gather(
+            *(_call_async(reg, event, event_name) for reg in async_handlers)
+        )
+
+
+async def _call_async(registration: _Registration, event: Any, event_name: str) -> None:
+    """Await one async handler, logging (and re-raising) its failure."""
+    _, handler, handler_name = registration
+    try:
+        logger.debug(
+            "handling_event",
+            event_type=event_name,
+            handler=handler_name,
+        )
+        await handler(event)
+    except Exception:
+        logger.exception(
+            "handler_failed",
+            event_type=event_name,
+            handler=handler_name,
+        )
+        raise
+
 
 async def publish_all(events: list[Any]) -> None:
     """Publish multiple events in order.
@@ -14,12 +14,22 @@ Design decisions:
 - Uses UnitOfWork for transaction boundaries
 - Returns AccountError for failures instead of raising exceptions
 - Collects events before commit for outbox pattern
+
+Performance notes:
+- These methods are I/O-bound orchestration: latency is the number of
+  database round trips, not Python compute. JIT/SIMD approaches (e.g.
+  Numba) don't apply.
+- Prefer one SQL statement that filters or guards in the database
+  (delete_account's DELETE ... WHERE NOT EXISTS ... RETURNING) over
+  loading rows and checking them here.
+- Pure reads use uow.readonly() to avoid transaction round trips.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ParamSpec
 
 from domain.events.account_events import AccountDeleted
 from domain.model.account import Account
@@ -32,8 +42,10 @@ from domain.model.rewards_balance import RewardsBalance
 if TYPE_CHECKING:
     from domain.ports.unit_of_work import UnitOfWork
 
+P = ParamSpec("P")  # Arguments of the Account factory passed to _create()
+
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AccountError:
     """Error result for account operations.
 
@@ -67,6 +79,8 @@ class AccountService:
         _uow: Unit of Work for transaction management.
     """
 
+    __slots__ = ("_uow",)
+
     def __init__(self, uow: "UnitOfWork") -> None:
         """Initialize AccountService with Unit of Work.
 
@@ -102,22 +116,17 @@ class AccountService:
         Returns:
             Created Account or AccountError on failure.
         """
-        with self._uow:
-            account = Account.create_checking(
-                user_id=user_id,
-                name=name,
-                opening_balance=opening_balance,
-                household_id=household_id,
-                institution=institution,
-                opening_date=opening_date,
-                account_number=account_number,
-                notes=notes,
-            )
-            self._uow.accounts.add(account)
-            self._uow.collect_events(account.events)
-            account.clear_events()
-            await self._uow.commit()
-            return account
+        return await self._create(
+            Account.create_checking,
+            user_id=user_id,
+            name=name,
+            opening_balance=opening_balance,
+            household_id=household_id,
+            institution=institution,
+            opening_date=opening_date,
+            account_number=account_number,
+            notes=notes,
+        )
 
     async def create_savings(
         self,
@@ -144,22 +153,17 @@ class AccountService:
         Returns:
             Created Account or AccountError on failure.
         """
-        with self._uow:
-            account = Account.create_savings(
-                user_id=user_id,
-                name=name,
-                opening_balance=opening_balance,
-                household_id=household_id,
-                institution=institution,
-                opening_date=opening_date,
-                account_number=account_number,
-                notes=notes,
-            )
-            self._uow.accounts.add(account)
-            self._uow.collect_events(account.events)
-            account.clear_events()
-            await self._uow.commit()
-            return account
+        return await self._create(
+            Account.create_savings,
+            user_id=user_id,
+            name=name,
+            opening_balance=opening_balance,
+            household_id=household_id,
+            institution=institution,
+            opening_date=opening_date,
+            account_number=account_number,
+            notes=notes,
+        )
 
     async def create_credit_card(
         self,
@@ -186,25 +190,17 @@ class AccountService:
         Returns:
             Created Account or AccountError on failure.
         """
-        try:
-            with self._uow:
-                account = Account.create_credit_card(
-                    user_id=user_id,
-                    name=name,
-                    opening_balance=opening_balance,
-                    credit_limit=credit_limit,
-                    household_id=household_id,
-                    institution=institution,
-                    opening_date=opening_date,
-                    notes=notes,
-                )
-                self._uow.accounts.add(account)
-                self._uow.collect_events(account.events)
-                account.clear_events()
-                await self._uow.commit()
-                return account
-        except ValueError as e:
-            return AccountError(code="VALIDATION_ERROR", message=str(e))
+        return await self._create(
+            Account.create_credit_card,
+            user_id=user_id,
+            name=name,
+            opening_balance=opening_balance,
+            credit_limit=credit_limit,
+            household_id=household_id,
+            institution=institution,
+            opening_date=opening_date,
+            notes=notes,
+        )
 
     async def create_loan(
         self,
@@ -237,25 +233,20 @@ class AccountService:
         Returns:
             Created Account or AccountError on failure.
         """
-        with self._uow:
-            account = Account.create_loan(
-                user_id=user_id,
-                name=name,
-                opening_balance=opening_balance,
-                subtype=subtype,
-                apr=apr,
-                term_months=term_months,
-                due_date=due_date,
-                household_id=household_id,
-                institution=institution,
-                opening_date=opening_date,
-                notes=notes,
-            )
-            self._uow.accounts.add(account)
-            self._uow.collect_events(account.events)
-            account.clear_events()
-            await self._uow.commit()
-            return account
+        return await self._create(
+            Account.create_loan,
+            user_id=user_id,
+            name=name,
+            opening_balance=opening_balance,
+            subtype=subtype,
+            apr=apr,
+            term_months=term_months,
+            due_date=due_date,
+            household_id=household_id,
+            institution=institution,
+            opening_date=opening_date,
+            notes=notes,
+        )
 
     async def create_brokerage(
         self,
@@ -280,21 +271,16 @@ class AccountService:
         Returns:
             Created Account or AccountError on failure.
         """
-        with self._uow:
-            account = Account.create_brokerage(
-                user_id=user_id,
-                name=name,
-                opening_balance=opening_balance,
-                household_id=household_id,
-                institution=institution,
-                opening_date=opening_date,
-                notes=notes,
-            )
-            self._uow.accounts.add(account)
-            self._uow.collect_events(account.events)
-            account.clear_events()
-            await self._uow.commit()
-            return account
+        return await self._create(
+            Account.create_brokerage,
+            user_id=user_id,
+            name=name,
+            opening_balance=opening_balance,
+            household_id=household_id,
+            institution=institution,
+            opening_date=opening_date,
+            notes=notes,
+        )
 
     async def create_ira(
         self,
@@ -321,25 +307,17 @@ class AccountService:
         Returns:
             Created Account or AccountError on failure.
         """
-        try:
-            with self._uow:
-                account = Account.create_ira(
-                    user_id=user_id,
-                    name=name,
-                    opening_balance=opening_balance,
-                    subtype=subtype,
-                    household_id=household_id,
-                    institution=institution,
-                    opening_date=opening_date,
-                    notes=notes,
-                )
-                self._uow.accounts.add(account)
-                self._uow.collect_events(account.events)
-                account.clear_events()
-                await self._uow.commit()
-                return account
-        except ValueError as e:
-            return AccountError(code="VALIDATION_ERROR", message=str(e))
+        return await self._create(
+            Account.create_ira,
+            user_id=user_id,
+            name=name,
+            opening_balance=opening_balance,
+            subtype=subtype,
+            household_id=household_id,
+            institution=institution,
+            opening_date=opening_date,
+            notes=notes,
+        )
 
     async def create_rewards(
         self,
@@ -364,21 +342,42 @@ class AccountService:
         Returns:
             Created Account or AccountError on failure.
         """
-        with self._uow:
-            account = Account.create_rewards(
-                user_id=user_id,
-                name=name,
-                rewards_balance=rewards_balance,
-                household_id=household_id,
-                institution=institution,
-                opening_date=opening_date,
-                notes=notes,
-            )
-            self._uow.accounts.add(account)
-            self._uow.collect_events(account.events)
-            account.clear_events()
-            await self._uow.commit()
-            return account
+        return await self._create(
+            Account.create_rewards,
+            user_id=user_id,
+            name=name,
+            rewards_balance=rewards_balance,
+            household_id=household_id,
+            institution=institution,
+            opening_date=opening_date,
+            notes=notes,
+        )
+
+    async def _create(
+        self, factory: Callable[P, Account], /, *args: P.args, **kwargs: P.kwargs
+    ) -> Account | AccountError:
+        """Run an Account factory and persist the result in one transaction.
+
+        Shared by all create_* methods. Domain validation failures
+        (ValueError) become VALIDATION_ERROR results.
+
+        Args:
+            factory: Account classmethod that builds the account.
+            *args: Positional arguments passed through to the factory.
+            **kwargs: Keyword arguments passed through to the factory.
+
+        Returns:
+            Created Account or AccountError on failure.
+        """
+        try:
+            with self._uow as uow:
+                account = factory(*args, **kwargs)
+                uow.accounts.add(account)
+                uow.collect_events(account.drain_events())
+                await uow.commit()
+                return account
+        except ValueError as e:
+            return AccountError(code="VALIDATION_ERROR", message=str(e))
 
     # --- Read Operations ---
 
@@ -400,7 +399,7 @@ class AccountService:
         Returns:
             The Account or AccountError if not found.
         """
-        with self._uow:
+        with self._uow.readonly():
             account = self._uow.accounts.get(account_id)
             if account is None:
                 return AccountError(
@@ -431,7 +430,7 @@ class AccountService:
         Returns:
             List of matching accounts, sorted by sort_order then name.
         """
-        with self._uow:
+        with self._uow.readonly():
             return self._uow.accounts.get_by_household(
                 household_id=household_id,
                 status=status,
@@ -454,7 +453,7 @@ class AccountService:
         Returns:
             List of matching accounts, sorted by sort_order then name.
         """
-        with self._uow:
+        with self._uow.readonly():
             return self._uow.accounts.get_by_user(
                 user_id=user_id,
                 status=status,
@@ -479,8 +478,8 @@ class AccountService:
         Returns:
             The closed Account or AccountError on failure.
         """
-        with self._uow:
-            account = self._uow.accounts.get(account_id)
+        with self._uow as uow:
+            account = uow.accounts.get(account_id)
             if account is None:
                 return AccountError(
                     code="NOT_FOUND",
@@ -493,9 +492,8 @@ class AccountService:
                 )
             try:
                 account.close(closed_by)
-                self._uow.collect_events(account.events)
-                account.clear_events()
-                await self._uow.commit()
+                uow.collect_events(account.drain_events())
+                await uow.commit()
                 return account
             except ValueError as e:
                 return AccountError(code="ALREADY_CLOSED", message=str(e))
@@ -516,8 +514,8 @@ class AccountService:
         Returns:
             The reopened Account or AccountError on failure.
         """
-        with self._uow:
-            account = self._uow.accounts.get(account_id)
+        with self._uow as uow:
+            account = uow.accounts.get(account_id)
             if account is None:
                 return AccountError(
                     code="NOT_FOUND",
@@ -530,9 +528,8 @@ class AccountService:
                 )
             try:
                 account.reopen(reopened_by)
-                self._uow.collect_events(account.events)
-                account.clear_events()
-                await self._uow.commit()
+                uow.collect_events(account.drain_events())
+                await uow.commit()
                 return account
             except ValueError as e:
                 return AccountError(code="NOT_CLOSED", message=str(e))
@@ -553,33 +550,26 @@ class AccountService:
         Returns:
             True on success, AccountError on failure.
         """
-        with self._uow:
-            account = self._uow.accounts.get(account_id)
-            if account is None:
+        with self._uow as uow:
+            # Ownership and usage checks run inside the DELETE itself
+            deleted = uow.accounts.delete_if_no_transactions(account_id, household_id)
+            if deleted is None:
                 return AccountError(
                     code="NOT_FOUND",
                     message=f"Account {account_id} not found",
                 )
-            if household_id is not None and account.household_id != household_id:
-                return AccountError(
-                    code="NOT_FOUND",
-                    message=f"Account {account_id} not found",
-                )
-
-            if self._uow.accounts.has_transactions(account_id):
+            if not deleted:
                 return AccountError(
                     code="HAS_TRANSACTIONS",
                     message="Cannot delete account with transactions. Close it instead.",
                 )
 
-            # Emit delete event before actual deletion
             delete_event = AccountDeleted(
-                aggregate_id=str(account.id),
+                aggregate_id=str(account_id),
                 aggregate_type="Account",
             )
-            self._uow.collect_events([delete_event])
-            self._uow.accounts.delete(account)
-            await self._uow.commit()
+            uow.collect_events([delete_event])
+            await uow.commit()
             return True
 
     # --- Update Operations ---
@@ -601,8 +591,8 @@ class AccountService:
         Returns:
             The updated Account or AccountError on failure.
         """
-        with self._uow:
-            account = self._uow.accounts.get(account_id)
+        with self._uow as uow:
+            account = uow.accounts.get(account_id)
             if account is None:
                 return AccountError(
                     code="NOT_FOUND",
@@ -615,9 +605,8 @@ class AccountService:
                 )
             try:
                 account.update_name(new_name, updated_by)
-                self._uow.collect_events(account.events)
-                account.clear_events()
-                await self._uow.commit()
+                uow.collect_events(account.drain_events())
+                await uow.commit()
                 return account
             except ValueError as e:
                 return AccountError(code="VALIDATION_ERROR", message=str(e))
@@ -16,10 +16,23 @@ Design decisions:
 - Generic error messages for auth failures (prevent user enumeration)
 - Password hashing delegated to security adapter (infrastructure)
 - JWT creation delegated to security adapter (infrastructure)
+
+Performance notes:
+- Cost is Argon2 CPU time plus database round trips; there is no numeric
+  code here, so JIT compilation (e.g. Numba) has nothing to accelerate.
+- Keep Argon2 work outside open transactions where the flow allows it:
+  register() hashes before entering the UoW so no pooled connection waits
+  on the hash. login() still verifies inside its UoW because the user
+  lookup and the refresh-token insert share that transaction.
+- get_user_profile() (GET /auth/me) is served from a short-TTL, per-process
+  LRU; write paths that change a User pop its entry.
 """
 
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from domain.model.entity_id import UserId
 from domain.model.household import Household
@@ -31,8 +44,27 @@ from src.adapters.security.tokens import generate_verification_token, verify_ema
 if TYPE_CHECKING:
     from domain.ports.unit_of_work import UnitOfWork
 
+# Verified against when the email is unknown, so login() spends the same
+# Argon2 time whether or not the account exists.
+_DUMMY_HASH = hash_password("x" * 16)
+
+# Bounds for the GET /auth/me profile cache. Entries are per process, so the
+# TTL is what limits staleness across workers.
+PROFILE_CACHE_MAXSIZE = 10_000
+PROFILE_CACHE_TTL_SECONDS = 10.0
+
+
+def _normalize_email(email: str) -> str:
+    """Strip surrounding whitespace and lowercase an email address.
+
+    Clients almost always send lowercase already, so lower() (and its
+    copy) is skipped when the stripped address has no uppercase letters.
+    """
+    email = email.strip()
+    return email if email.islower() else email.lower()
+
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AuthError:
     """Error result for authentication operations.
 
@@ -48,7 +80,7 @@ class AuthError:
     message: str
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AuthTokens:
     """Token pair returned on successful authentication.
 
@@ -63,19 +95,75 @@ class AuthTokens:
     token_type: str = "bearer"
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class RegistrationResult:
     """Result of successful user registration.
 
     Attributes:
         user: The newly created User
         household: The newly created Household
-        verification_token: Email verification token to send to user
     """
 
     user: User
     household: Household
-    verification_token: str
+
+    @property
+    def verification_token(self) -> str:
+        """Email verification token for the new user.
+
+        Signed on access: the verification email is sent by the
+        UserRegistered handler with its own token, so register() callers
+        that don't need one (the HTTP route) skip the signing.
+        """
+        return generate_verification_token(self.user.email)
+
+
+class _ProfileCache:
+    """Bounded LRU of (User, Household) pairs whose entries expire after a TTL.
+
+    Thread-safe, since sync routes run in the threadpool.
+    """
+
+    __slots__ = ("_entries", "_lock", "_maxsize", "_ttl")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._entries: OrderedDict[UserId, tuple[float, tuple[User, Household]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, user_id: UserId) -> tuple[User, Household] | None:
+        """Return the cached profile, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, profile = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return profile
+
+    def put(self, user_id: UserId, profile: tuple[User, Household]) -> None:
+        """Cache a profile, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self._ttl, profile)
+            self._entries.move_to_end(user_id)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, user_id: UserId) -> None:
+        """Drop a user's cached profile, if any."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached profiles."""
+        with self._lock:
+            self._entries.clear()
 
 
 class AuthService:
@@ -94,8 +182,21 @@ class AuthService:
 
     Attributes:
         _uow: Unit of Work for transaction management.
+        _profile_cache: Process-wide cache behind get_user_profile().
     """
 
+    __slots__ = ("_uow",)
+
+    # Shared across instances: the service is built per request.
+    _profile_cache: ClassVar[_ProfileCache] = _ProfileCache(
+        PROFILE_CACHE_MAXSIZE, PROFILE_CACHE_TTL_SECONDS
+    )
+
+    @classmethod
+    def clear_profile_cache(cls) -> None:
+        """Drop every cached profile (used to isolate tests)."""
+        cls._profile_cache.clear()
+
     def __init__(self, uow: "UnitOfWork") -> None:
         """Initialize AuthService with Unit of Work.
 
@@ -123,7 +224,13 @@ class AuthService:
         Returns:
             RegistrationResult on success, AuthError if email already exists.
         """
-        normalized_email = email.lower().strip()
+        normalized_email = _normalize_email(email)
+
+        # Hash password (infrastructure concern) before opening the
+        # transaction so the deliberately slow Argon2 work doesn't hold a
+        # pooled connection. Duplicate emails now also pay the hashing cost,
+        # so response timing no longer reveals whether an email exists.
+        password_hash = hash_password(password)
 
         with self._uow:
             # Check for existing email
@@ -134,9 +241,6 @@ class AuthService:
                     message="Registration failed",
                 )
 
-            # Hash password (infrastructure concern)
-            password_hash = hash_password(password)
-
             # Create household and user (no circular FK dependency)
             household = Household.create(name=f"{display_name}'s Household")
             user = User.create(
@@ -152,19 +256,11 @@ class AuthService:
             self._uow.users.add(user)
 
             # Collect events from user (UserRegistered)
-            events = user.collect_events()
-            self._uow.collect_events(events)
+            self._uow.collect_events(user.collect_events())
 
             await self._uow.commit()
 
-            # Generate verification token (outside transaction - stateless)
-            verification_token = generate_verification_token(user.email)
-
-            return RegistrationResult(
-                user=user,
-                household=household,
-                verification_token=verification_token,
-            )
+            return RegistrationResult(user=user, household=household)
 
     async def login(
         self,
@@ -184,27 +280,24 @@ class AuthService:
         Returns:
             AuthTokens on success, AuthError on failure.
         """
-        normalized_email = email.lower().strip()
+        normalized_email = _normalize_email(email)
 
         with self._uow:
             # Look up user by email
             user = self._uow.users.get_by_email(normalized_email)
 
-            # Generic error for nonexistent email (prevent user enumeration)
-            if user is None:
+            # Always run Argon2 (against a dummy hash for unknown emails) and
+            # only branch afterwards, so timing doesn't reveal whether the
+            # email exists (prevent user enumeration)
+            target_hash = user.password_hash if user is not None else _DUMMY_HASH
+            password_ok = verify_password(password, target_hash)
+            if user is None or not password_ok:
                 return AuthError(
                     code="INVALID_CREDENTIALS",
                     message="Invalid credentials",
                 )
 
-            # Verify password
-            if not verify_password(password, user.password_hash):
-                return AuthError(
-                    code="INVALID_CREDENTIALS",
-                    message="Invalid credentials",
-                )
-
-            # Check email verification
+            # Check email verification (only reported for valid credentials)
             if not user.email_verified:
                 return AuthError(
                     code="EMAIL_NOT_VERIFIED",
@@ -245,29 +338,25 @@ class AuthService:
             AuthTokens on success, AuthError if token is invalid/expired.
         """
         with self._uow:
-            # Validate and rotate refresh token
+            # Validate and rotate refresh token; the owning user's household
+            # comes back from the same statement
             result = self._uow.refresh_tokens.validate_and_rotate(refresh_token)
 
             if result is None:
+                # A reused token has just had its whole family revoked; commit
+                # so that sticks (for unknown or expired tokens nothing changed)
+                await self._uow.commit()
                 return AuthError(
                     code="INVALID_REFRESH_TOKEN",
                     message="Invalid or expired refresh token",
                 )
 
-            new_raw_token, token_record = result
-
-            # Look up user to get household_id for access token
-            user = self._uow.users.get_by_id(token_record.user_id)
-            if user is None:
-                return AuthError(
-                    code="INVALID_REFRESH_TOKEN",
-                    message="Invalid or expired refresh token",
-                )
+            new_raw_token, token_record, household_id = result
 
             # Create new access token
             access_token = create_access_token(
-                user_id=str(user.id),
-                household_id=str(user.household_id),
+                user_id=token_record.user_id,
+                household_id=str(household_id),
             )
 
             await self._uow.commit()
@@ -310,11 +399,14 @@ class AuthService:
             user.verify_email()
 
             # Collect events
-            events = user.collect_events()
-            self._uow.collect_events(events)
+            self._uow.collect_events(user.collect_events())
 
             await self._uow.commit()
 
+            # Evict after commit so a concurrent read can't re-cache the
+            # unverified state
+            self._profile_cache.pop(user.id)
+
             return user
 
     async def logout_all_sessions(
@@ -346,7 +438,7 @@ class AuthService:
         Returns:
             User if found, None otherwise.
         """
-        with self._uow:
+        with self._uow.readonly():
             return self._uow.users.get_by_id(user_id)
 
     def get_user_profile(
@@ -356,6 +448,7 @@ class AuthService:
         """Load user and household for profile endpoint.
 
         Used by GET /auth/me to return user metadata with nested household info.
+        Results are cached for PROFILE_CACHE_TTL_SECONDS; misses are not.
 
         Args:
             user_id: The user identifier.
@@ -363,11 +456,14 @@ class AuthService:
         Returns:
             Tuple of (User, Household) if found, None if user not found.
         """
-        with self._uow:
-            user = self._uow.users.get_by_id(user_id)
-            if user is None:
+        cached = self._profile_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        with self._uow.readonly():
+            # One JOINed query rather than separate user and household reads
+            profile = self._uow.users.get_with_household(user_id)
+            if profile is None:
                 return None
-            household = self._uow.households.get_by_id(user.household_id)
-            if household is None:
-                return None  # Should not happen if FK constraint enforced
-            return (user, household)
+            self._profile_cache.put(user_id, profile)
+            return profile
@@ -242,11 +242,10 @@ class CategoryService:
 
             # TODO: Reassign transactions (will be added when transaction filter by category works)
             # For now, just check if there are transactions
-            txn_count = self._uow.categories.count_transactions(category_id)
-            if txn_count > 0:
+            if self._uow.categories.has_transactions(category_id):
                 return CategoryError(
                     "HAS_TRANSACTIONS",
-                    f"Category has {txn_count} transaction(s). Reassign them first.",
+                    "Category has transactions. Reassign them first.",
                 )
 
             category.delete()
@@ -27,6 +27,16 @@ settings.register_profile("ci", max_examples=200, deadline=None)
 settings.register_profile("dev", max_examples=50, deadline=None)
 
 
+@pytest.fixture(autouse=True)
+def _reset_profile_cache():
+    """Start every test with an empty process-wide profile cache."""
+    from src.application.services.auth_service import AuthService
+
+    AuthService.clear_profile_cache()
+    yield
+    AuthService.clear_profile_cache()
+
+
 @pytest.fixture
 def usd_100() -> Money:
     """Create a Money instance for $100 USD."""
@@ -8,7 +8,7 @@ attribute types (e.g., AccountId -> str). Tests capture IDs before commit
 to ensure correct comparisons with loaded entities.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from decimal import Decimal
 
 import pytest
@@ -20,7 +20,12 @@ from domain.model.entity_id import AccountId, HouseholdId, UserId
 from domain.model.institution import InstitutionDetails
 from domain.model.money import Money
 from domain.model.rewards_balance import RewardsBalance
+from domain.model.split_line import SplitLine
+from domain.model.transaction import Transaction
 from src.adapters.persistence.repositories.account import SqlAlchemyAccountRepository
+from src.adapters.persistence.repositories.transaction import (
+    SqlAlchemyTransactionRepository,
+)
 
 
 @pytest.fixture
@@ -76,6 +81,27 @@ def usd_balance():
     return Money(Decimal("1000.00"), "USD")
 
 
+def _add_transaction(
+    session,
+    user_id: UserId,
+    household_id: HouseholdId,
+    account_id: AccountId,
+    transfer_account_id: AccountId | None = None,
+) -> None:
+    """Persist a $25 outflow on account_id, optionally as a transfer."""
+    amount = Money(Decimal("-25.00"), "USD")
+    transaction = Transaction.create(
+        user_id=user_id,
+        account_id=account_id,
+        effective_date=date(2024, 1, 15),
+        amount=amount,
+        splits=[SplitLine.create(amount, transfer_account_id=transfer_account_id)],
+        household_id=household_id,
+    )
+    SqlAlchemyTransactionRepository(session).add(transaction)
+    session.commit()
+
+
 class TestAccountPersistence:
     """Test Account CRUD operations."""
 
@@ -390,10 +416,83 @@ class TestAccountPersistence:
         assert repository.get(account_id) is None
 
     def test_has_transactions_returns_false(self, repository):
-        """has_transactions returns False (placeholder until Phase 3)."""
+        """has_transactions returns False for an account nothing references."""
         account_id = AccountId.generate()
         assert repository.has_transactions(account_id) is False
 
+    def test_delete_if_no_transactions(
+        self, session, repository, user_id, household_id, usd_balance
+    ):
+        """Unused accounts are deleted in one step."""
+        account = Account.create_checking(
+            user_id, "Delete Me", usd_balance, household_id=household_id
+        )
+        account.clear_events()
+        repository.add(account)
+        session.commit()
+
+        assert repository.delete_if_no_transactions(account.id, household_id) is True
+        session.commit()
+
+        session.expunge_all()
+        assert repository.get(account.id) is None
+
+    def test_delete_if_no_transactions_not_found(
+        self, session, repository, user_id, household_id, usd_balance
+    ):
+        """Missing or cross-household accounts report None and stay put."""
+        assert repository.delete_if_no_transactions(AccountId.generate()) is None
+
+        account = Account.create_checking(
+            user_id, "Keep Me", usd_balance, household_id=household_id
+        )
+        account.clear_events()
+        repository.add(account)
+        session.commit()
+
+        other_household = HouseholdId.generate()
+        assert repository.delete_if_no_transactions(account.id, other_household) is None
+        assert repository.get(account.id) is not None
+
+    def test_account_with_transaction_is_in_use(
+        self, session, repository, user_id, household_id, usd_balance
+    ):
+        """A posted transaction keeps the account from being deleted."""
+        account = Account.create_checking(
+            user_id, "In Use", usd_balance, household_id=household_id
+        )
+        account.clear_events()
+        repository.add(account)
+        session.commit()
+        _add_transaction(session, user_id, household_id, account.id)
+
+        assert repository.has_transactions(account.id) is True
+        assert repository.delete_if_no_transactions(account.id, household_id) is False
+        assert repository.get(account.id) is not None
+
+    def test_transfer_target_is_in_use(
+        self, session, repository, user_id, household_id, usd_balance
+    ):
+        """An account referenced only by a transfer split counts as in use."""
+        source = Account.create_checking(
+            user_id, "Source", usd_balance, household_id=household_id
+        )
+        target = Account.create_savings(
+            user_id, "Target", usd_balance, household_id=household_id
+        )
+        source.clear_events()
+        target.clear_events()
+        repository.add(source)
+        repository.add(target)
+        session.commit()
+        _add_transaction(
+            session, user_id, household_id, source.id, transfer_account_id=target.id
+        )
+
+        assert repository.has_transactions(target.id) is True
+        assert repository.delete_if_no_transactions(target.id, household_id) is False
+        assert repository.get(target.id) is not None
+
 
 class TestAccountUpdate:
     """Test account update operations via repository."""
@@ -1,6 +1,5 @@
 """Integration tests for database and migrations."""
 
-import json
 from datetime import UTC, datetime
 
 import pytest
@@ -64,7 +63,7 @@ class TestOutboxPattern:
                 event_type="TestEvent",
                 aggregate_type="TestAggregate",
                 aggregate_id="test_123",
-                payload=json.dumps({"key": "value"}),
+                payload={"key": "value"},
                 created_at=datetime.now(UTC),
             )
         )
@@ -86,7 +85,7 @@ class TestOutboxPattern:
                 event_type="TestEvent",
                 aggregate_type="TestAggregate",
                 aggregate_id="test_456",
-                payload="{}",
+                payload={},
                 created_at=datetime.now(UTC),
             )
         )
@@ -114,7 +113,7 @@ class TestOutboxPattern:
                 event_type="ProcessedEvent",
                 aggregate_type="Test",
                 aggregate_id="processed_test_idx",
-                payload="{}",
+                payload={},
                 created_at=datetime.now(UTC),
                 processed_at=datetime.now(UTC),
             )
@@ -125,7 +124,7 @@ class TestOutboxPattern:
                 event_type="UnprocessedEvent",
                 aggregate_type="Test",
                 aggregate_id="unprocessed_test_idx",
-                payload="{}",
+                payload={},
                 created_at=datetime.now(UTC),
                 processed_at=None,
             )
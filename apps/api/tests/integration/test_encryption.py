@@ -55,6 +55,36 @@ class TestFieldEncryptionRoundTrip:
         assert field_encryption.decrypt(encrypted1) == plaintext
         assert field_encryption.decrypt(encrypted2) == plaintext
 
+    def test_encrypt_many_round_trips_in_order(self, field_encryption):
+        """Batch encryption matches single-value decrypt, in order."""
+        plaintexts = ["first", "", "third \U0001f512", "first"]
+        encrypted = field_encryption.encrypt_many(plaintexts)
+
+        assert len(encrypted) == len(plaintexts)
+        # Each value gets its own nonce
+        assert encrypted[0] != encrypted[3]
+        assert [field_encryption.decrypt(e) for e in encrypted] == plaintexts
+        assert field_encryption.decrypt_many(encrypted) == plaintexts
+
+    def test_encrypt_many_empty_list(self, field_encryption):
+        """Empty batches are a no-op."""
+        assert field_encryption.encrypt_many([]) == []
+        assert field_encryption.decrypt_many([]) == []
+
+    def test_chacha_values_round_trip_across_instances(self, encryption_key):
+        """ChaCha20 values decrypt on AES-GCM instances and vice versa."""
+        chacha = FieldEncryption(encryption_key, use_chacha=True)
+        aes = FieldEncryption(encryption_key, use_chacha=False)
+
+        chacha_value = chacha.encrypt("portable")
+        aes_value = aes.encrypt("portable")
+
+        assert chacha_value.startswith("c20p:")
+        assert not aes_value.startswith("c20p:")
+        assert aes.decrypt(chacha_value) == "portable"
+        assert chacha.decrypt(aes_value) == "portable"
+        assert aes.decrypt_many(chacha.encrypt_many(["a", "b"])) == ["a", "b"]
+
 
 class TestFieldEncryptionSecurity:
     """Test encryption security properties."""
@@ -105,6 +135,42 @@ class TestFieldEncryptionKeyLoading:
 
         assert decrypted == plaintext
 
+    def test_default_is_loaded_once_and_shared(self, env_encryption_key, monkeypatch):
+        """default() memoizes a single instance for the process."""
+        monkeypatch.setattr(FieldEncryption, "_default", None)
+
+        first = FieldEncryption.default()
+        second = FieldEncryption.default()
+
+        assert first is second
+        assert second.decrypt(first.encrypt("shared")) == "shared"
+
+    def test_load_raw_key_from_docker_secret(self, tmp_path):
+        """Raw 32-byte secrets are used verbatim, even with edge whitespace."""
+        key = b"\n" + FieldEncryption.generate_key()[1:-1] + b" "
+        (tmp_path / "encryption_key").write_bytes(key)
+
+        encryptor = FieldEncryption.from_docker_secret(secrets_dir=str(tmp_path))
+
+        assert FieldEncryption(key).decrypt(encryptor.encrypt("raw")) == "raw"
+
+    def test_load_base64_key_from_docker_secret(self, encryption_key, tmp_path):
+        """Base64 secrets with a trailing newline are decoded."""
+        encoded = base64.b64encode(encryption_key) + b"\n"
+        (tmp_path / "encryption_key").write_bytes(encoded)
+
+        encryptor = FieldEncryption.from_docker_secret(secrets_dir=str(tmp_path))
+
+        decryptor = FieldEncryption(encryption_key)
+        assert decryptor.decrypt(encryptor.encrypt("b64")) == "b64"
+
+    def test_malformed_docker_secret_raises(self, tmp_path):
+        """Secrets that are neither raw nor base64 keys fail clearly."""
+        (tmp_path / "encryption_key").write_bytes(b"not a key!")
+
+        with pytest.raises(ValueError, match="32 raw bytes"):
+            FieldEncryption.from_docker_secret(secrets_dir=str(tmp_path))
+
     def test_invalid_key_length_raises(self):
         """Key must be exactly 32 bytes."""
         with pytest.raises(ValueError, match="32 bytes"):
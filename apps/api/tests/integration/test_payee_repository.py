@@ -0,0 +1,107 @@
+"""Integration tests for Payee repository.
+
+Covers the INSERT ... ON CONFLICT get-or-create path, which relies on the
+unique (user_id, normalized_name) index and only runs against PostgreSQL.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+
+from domain.model.entity_id import HouseholdId, UserId
+from src.adapters.persistence.orm.tables import payees
+from src.adapters.persistence.repositories.payee import SqlAlchemyPayeeRepository
+
+
+@pytest.fixture
+def household_id(session):
+    """Create a test household and return ID."""
+    from src.adapters.persistence.orm.tables import households
+
+    hh_id = HouseholdId.generate()
+    session.execute(
+        households.insert().values(
+            id=str(hh_id),
+            name="Test Household",
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+    )
+    session.commit()
+    return hh_id
+
+
+@pytest.fixture
+def user_id(session, household_id):
+    """Create a test user and return ID."""
+    from src.adapters.persistence.orm.tables import users
+
+    uid = UserId.generate()
+    session.execute(
+        users.insert().values(
+            id=str(uid),
+            email=f"test-{uid}@example.com",
+            display_name="Test User",
+            password_hash="$argon2id$v=19$m=65536,t=3,p=4$placeholder",
+            household_id=str(household_id),
+            role="owner",
+            email_verified=True,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+    )
+    session.commit()
+    return uid
+
+
+@pytest.fixture
+def repository(session):
+    """Create repository with test session."""
+    return SqlAlchemyPayeeRepository(session)
+
+
+class TestPayeeGetOrCreate:
+    """Test the single-statement upsert behind get_or_create()."""
+
+    def test_creates_payee_on_first_use(self, repository, user_id, household_id):
+        """A new name inserts a payee with the trimmed display name."""
+        payee = repository.get_or_create(user_id, "  Starbucks ", household_id)
+
+        assert payee.name == "Starbucks"
+        assert payee.normalized_name == "starbucks"
+        assert str(payee.household_id) == str(household_id)
+
+    def test_differently_cased_name_returns_existing_payee(
+        self, session, repository, user_id, household_id
+    ):
+        """Same normalized name resolves to the existing row, not a duplicate."""
+        first = repository.get_or_create(user_id, "Starbucks", household_id)
+        first_id = str(first.id)
+
+        second = repository.get_or_create(user_id, "STARBUCKS", household_id)
+
+        assert str(second.id) == first_id
+        rows = session.execute(
+            select(payees.c.id).where(payees.c.user_id == str(user_id))
+        ).all()
+        assert len(rows) == 1
+
+    def test_returned_payee_changes_are_flushed(
+        self, session, repository, user_id, household_id
+    ):
+        """The upserted entity is session-managed, so record_usage() persists."""
+        repository.get_or_create(user_id, "Starbucks", household_id)
+        payee = repository.get_or_create(user_id, "starbucks", household_id)
+        payee_id = str(payee.id)
+
+        payee.record_usage()
+        session.flush()
+
+        row = session.execute(
+            select(payees.c.usage_count, payees.c.last_used_at).where(
+                payees.c.id == payee_id
+            )
+        ).one()
+        assert row.usage_count == 1
+        assert row.last_used_at is not None
@@ -0,0 +1,94 @@
+"""Integration tests for refresh token reuse detection.
+
+Runs AuthService.refresh() on a real session factory, so a family revocation
+only shows up here if the unit of work actually commits it.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from domain.model.entity_id import HouseholdId, UserId
+from src.adapters.persistence.orm.tables import households, refresh_tokens, users
+from src.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from src.application.services.auth_service import AuthError, AuthService, AuthTokens
+
+
+@pytest.fixture
+def session_factory(engine, setup_database):
+    """Create session factory for UoW."""
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def user_id(session_factory: sessionmaker) -> UserId:
+    """Create and commit a household and user, returning the user ID."""
+    hh_id = HouseholdId.generate()
+    uid = UserId.generate()
+    now = datetime.now(UTC)
+    with session_factory() as session:
+        session.execute(
+            households.insert().values(
+                id=str(hh_id),
+                name="Test Household",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        session.execute(
+            users.insert().values(
+                id=str(uid),
+                email=f"test-{uid}@example.com",
+                display_name="Test User",
+                password_hash="$argon2id$v=19$m=65536,t=3,p=4$placeholder",
+                household_id=str(hh_id),
+                role="owner",
+                email_verified=True,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        session.commit()
+    return uid
+
+
+class TestRefreshTokenReuse:
+    """Replaying a rotated refresh token revokes its whole family."""
+
+    def test_reused_token_revokes_rotated_sibling(
+        self, session_factory: sessionmaker, user_id: UserId
+    ) -> None:
+        """The token issued by the first rotation is revoked after a replay."""
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            old_token, _record = uow.refresh_tokens.create_token(user_id=user_id)
+            asyncio.run(uow.commit())
+
+        rotated = asyncio.run(
+            AuthService(SqlAlchemyUnitOfWork(session_factory)).refresh(old_token)
+        )
+        assert isinstance(rotated, AuthTokens)
+
+        replayed = asyncio.run(
+            AuthService(SqlAlchemyUnitOfWork(session_factory)).refresh(old_token)
+        )
+        assert isinstance(replayed, AuthError)
+        assert replayed.code == "INVALID_REFRESH_TOKEN"
+
+        with session_factory() as session:
+            revoked = session.execute(
+                select(refresh_tokens.c.revoked_at).where(
+                    refresh_tokens.c.user_id == str(user_id)
+                )
+            ).scalars()
+            assert [value is not None for value in revoked] == [True, True]
+
+        # The sibling can no longer be exchanged either
+        sibling = asyncio.run(
+            AuthService(SqlAlchemyUnitOfWork(session_factory)).refresh(
+                rotated.refresh_token
+            )
+        )
+        assert isinstance(sibling, AuthError)
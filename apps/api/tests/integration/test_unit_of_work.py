@@ -0,0 +1,172 @@
+"""Integration tests for SqlAlchemyUnitOfWork transaction handling.
+
+Each test uses a real session factory, so data committed here is visible
+across units of work.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from domain.events.account_events import AccountUpdated
+from domain.model.entity_id import AccountId
+from domain.model.household import Household
+from src.adapters.persistence import unit_of_work
+from src.adapters.persistence.orm.tables import households, outbox
+from src.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def session_factory(engine, setup_database):
+    """Create session factory for UoW."""
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture(params=["psycopg2", "psycopg"])
+def copy_engine(request, database_url, setup_database, monkeypatch):
+    """Engine per PostgreSQL driver, with outbox COPY forced on.
+
+    _copy_outbox() has a separate branch for each driver's COPY API.
+    """
+    monkeypatch.setattr(unit_of_work, "OUTBOX_COPY_THRESHOLD", 2)
+    url = make_url(database_url).set(drivername=f"postgresql+{request.param}")
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
+
+
+def _account_events(aggregate_id: str) -> list[AccountUpdated]:
+    """Events whose payloads need CSV quoting and JSON escaping."""
+    return [
+        AccountUpdated(
+            aggregate_id=aggregate_id,
+            aggregate_type="Account",
+            field="name",
+            old_value='Joint "household", checking',
+            new_value="Line one\nline two \\ caf\u00e9",
+        ),
+        AccountUpdated(
+            aggregate_id=aggregate_id,
+            aggregate_type="Account",
+            field="notes",
+            old_value=None,
+            new_value="",
+        ),
+    ]
+
+
+class TestOutboxCopy:
+    """Tests for the COPY path used for large outbox batches."""
+
+    def test_commit_writes_outbox_rows_with_copy(self, copy_engine) -> None:
+        """Rows land with intact JSONB payloads, alongside the business data."""
+        inserts: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO outbox"):
+                inserts.append(statement)
+
+        event.listen(copy_engine, "before_cursor_execute", record)
+        aggregate_id = str(AccountId.generate())
+        events = _account_events(aggregate_id)
+        household = Household.create(name="Copy Household")
+        household_id = str(household.id)
+
+        uow = SqlAlchemyUnitOfWork(sessionmaker(bind=copy_engine))
+        with uow:
+            uow.households.add(household)
+            uow.collect_events(events)
+            asyncio.run(uow.commit())
+
+        with copy_engine.connect() as conn:
+            rows = conn.execute(
+                select(outbox.c.event_type, outbox.c.aggregate_type, outbox.c.payload)
+                .where(outbox.c.aggregate_id == aggregate_id)
+                .order_by(outbox.c.id)
+            ).all()
+            saved_household = conn.execute(
+                select(households.c.id).where(households.c.id == household_id)
+            ).scalar_one_or_none()
+
+        assert inserts == []  # went through COPY, not INSERT
+        assert [(r.event_type, r.aggregate_type) for r in rows] == [
+            ("AccountUpdated", "Account"),
+            ("AccountUpdated", "Account"),
+        ]
+        assert [r.payload for r in rows] == [e.to_dict() for e in events]
+        assert saved_household == household_id
+
+    def test_failed_commit_discards_copied_rows(self, copy_engine) -> None:
+        """COPY runs in the UoW transaction, so a failed commit drops its rows."""
+        existing = Household.create(name="Existing Household")
+        with SqlAlchemyUnitOfWork(sessionmaker(bind=copy_engine)) as uow:
+            uow.households.add(existing)
+            asyncio.run(uow.commit())
+
+        aggregate_id = str(AccountId.generate())
+        uow = SqlAlchemyUnitOfWork(sessionmaker(bind=copy_engine))
+        with uow:
+            # Same primary key: the INSERT flushed at commit, after the COPY,
+            # fails and the whole transaction rolls back
+            uow.households.add(Household(id=existing.id, name="Duplicate"))
+            uow.collect_events(_account_events(aggregate_id))
+            with pytest.raises(IntegrityError):
+                asyncio.run(uow.commit())
+
+        with copy_engine.connect() as conn:
+            rows = conn.execute(
+                select(outbox.c.id).where(outbox.c.aggregate_id == aggregate_id)
+            ).all()
+        assert rows == []
+
+    def test_exception_before_commit_writes_nothing(self, copy_engine) -> None:
+        """Events collected in a unit of work that raises never reach the outbox."""
+        aggregate_id = str(AccountId.generate())
+        uow = SqlAlchemyUnitOfWork(sessionmaker(bind=copy_engine))
+        try:
+            with uow:
+                uow.collect_events(_account_events(aggregate_id))
+                raise ValueError("Test rollback")
+        except ValueError:
+            pass
+
+        with copy_engine.connect() as conn:
+            rows = conn.execute(
+                select(outbox.c.id).where(outbox.c.aggregate_id == aggregate_id)
+            ).all()
+        assert rows == []
+
+
+class TestReadonlyUnitOfWork:
+    """Tests for the AUTOCOMMIT readonly() unit of work."""
+
+    def test_reads_committed_data(self, session_factory: sessionmaker) -> None:
+        """Repositories work inside readonly() and see committed rows."""
+        household = Household.create(name="Readonly Household")
+        household_id = household.id
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            uow.households.add(household)
+            asyncio.run(uow.commit())
+
+        reader = SqlAlchemyUnitOfWork(session_factory)
+        with reader.readonly():
+            loaded = reader.households.get_by_id(household_id)
+
+        assert loaded is not None
+        assert loaded.name == "Readonly Household"
+
+    def test_connection_runs_in_autocommit(self, session_factory: sessionmaker) -> None:
+        """The driver connection has no open transaction inside readonly()."""
+        reader = SqlAlchemyUnitOfWork(session_factory)
+        with reader.readonly():
+            connection = reader.session.connection()
+            options = connection.get_execution_options()
+            dbapi_connection: Any = connection.connection.driver_connection
+
+            assert options["isolation_level"] == "AUTOCOMMIT"
+            assert dbapi_connection.autocommit is True
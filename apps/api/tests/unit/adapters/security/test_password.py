@@ -21,6 +21,25 @@ class TestHashPassword:
 
         assert hash1 != hash2  # Different salts
 
+    def test_hash_uses_pinned_parameters(self) -> None:
+        """hash_password encodes the module's pinned Argon2id parameters."""
+        from src.adapters.security.password import (
+            ARGON2_MEMORY_COST_KIB,
+            ARGON2_PARALLELISM,
+            ARGON2_TIME_COST,
+            hash_password,
+        )
+
+        result = hash_password("TestPassword123!")
+
+        assert result.startswith("$argon2id$")
+        assert (
+            f"m={ARGON2_MEMORY_COST_KIB},t={ARGON2_TIME_COST},p={ARGON2_PARALLELISM}"
+            in result
+        )
+        # Same cost as the hashes already stored for existing accounts
+        assert "m=65536,t=3,p=4" in result
+
 
 class TestVerifyPassword:
     """Tests for verify_password function."""
@@ -49,3 +68,13 @@ class TestVerifyPassword:
         hashed = hash_password("RealPassword")
 
         assert verify_password("", hashed) is False
+
+    def test_hash_with_previous_parameters_still_verifies(self) -> None:
+        """verify_password accepts hashes created with argon2-cffi defaults."""
+        from argon2 import PasswordHasher
+
+        from src.adapters.security.password import verify_password
+
+        hashed = PasswordHasher().hash("LegacyPassword123!")
+
+        assert verify_password("LegacyPassword123!", hashed) is True
@@ -75,3 +75,19 @@ class TestVerifyEmailToken:
         result = verify_email_token(token, max_age=-1)
 
         assert result is None
+
+    def test_token_signed_with_previous_sha1_signer_still_verifies(self) -> None:
+        """Tokens issued before the BLAKE2b switch remain valid."""
+        from itsdangerous import URLSafeTimedSerializer
+
+        from src.adapters.security.tokens import (
+            EMAIL_VERIFICATION_SALT,
+            TOKEN_SECRET,
+            verify_email_token,
+        )
+
+        legacy = URLSafeTimedSerializer(TOKEN_SECRET).dumps(
+            "test@example.com", salt=EMAIL_VERIFICATION_SALT
+        )
+
+        assert verify_email_token(legacy) == "test@example.com"
@@ -13,7 +13,7 @@ All tests use mock UnitOfWork to isolate service behavior.
 
 import asyncio
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -200,6 +200,28 @@ class TestAccountCreation:
         assert result.term_months == 60
         mock_uow.commit.assert_called_once()
 
+    def test_create_loan_validation_error(
+        self, service: AccountService, mock_uow, user_id: UserId, usd_balance: Money
+    ):
+        """A ValueError from the factory becomes a VALIDATION_ERROR result."""
+        with patch.object(
+            Account, "create_loan", side_effect=ValueError("Term must be positive")
+        ):
+            result = asyncio.run(
+                service.create_loan(
+                    user_id=user_id,
+                    name="Car Loan",
+                    opening_balance=usd_balance,
+                    term_months=-12,
+                )
+            )
+
+        assert isinstance(result, AccountError)
+        assert result.code == "VALIDATION_ERROR"
+        assert result.message == "Term must be positive"
+        mock_uow.accounts.add.assert_not_called()
+        mock_uow.commit.assert_not_called()
+
     def test_create_brokerage_account(
         self, service: AccountService, mock_uow, user_id: UserId, usd_balance: Money
     ):
@@ -464,20 +486,17 @@ class TestLifecycleOperations:
 class TestDeleteOperations:
     """Tests for delete operation."""
 
-    def test_delete_account_success(
-        self, service: AccountService, mock_uow, user_id: UserId, usd_balance: Money
-    ):
+    def test_delete_account_success(self, service: AccountService, mock_uow):
         """Deletes account without transactions, collects event, commits."""
-        account = Account.create_checking(
-            user_id=user_id, name="Checking", opening_balance=usd_balance
-        )
-        mock_uow.accounts.get.return_value = account
-        mock_uow.accounts.has_transactions.return_value = False
+        account_id = AccountId.generate()
+        mock_uow.accounts.delete_if_no_transactions.return_value = True
 
-        result = asyncio.run(service.delete_account(account.id))
+        result = asyncio.run(service.delete_account(account_id))
 
         assert result is True
-        mock_uow.accounts.delete.assert_called_once_with(account)
+        mock_uow.accounts.delete_if_no_transactions.assert_called_once_with(
+            account_id, None
+        )
         mock_uow.collect_events.assert_called_once()
         mock_uow.commit.assert_called_once()
 
@@ -485,35 +504,31 @@ class TestDeleteOperations:
         assert len(mock_uow._collected_events) == 1
         event = mock_uow._collected_events[0]
         assert isinstance(event, AccountDeleted)
+        assert event.aggregate_id == str(account_id)
 
     def test_delete_account_not_found(self, service: AccountService, mock_uow):
         """Returns AccountError when account not found."""
         account_id = AccountId.generate()
-        mock_uow.accounts.get.return_value = None
+        mock_uow.accounts.delete_if_no_transactions.return_value = None
 
         result = asyncio.run(service.delete_account(account_id))
 
         assert isinstance(result, AccountError)
         assert result.code == "NOT_FOUND"
-        mock_uow.accounts.delete.assert_not_called()
+        mock_uow.collect_events.assert_not_called()
         mock_uow.commit.assert_not_called()
 
-    def test_delete_account_with_transactions(
-        self, service: AccountService, mock_uow, user_id: UserId, usd_balance: Money
-    ):
+    def test_delete_account_with_transactions(self, service: AccountService, mock_uow):
         """Returns AccountError when account has transactions."""
-        account = Account.create_checking(
-            user_id=user_id, name="Checking", opening_balance=usd_balance
-        )
-        mock_uow.accounts.get.return_value = account
-        mock_uow.accounts.has_transactions.return_value = True
+        account_id = AccountId.generate()
+        mock_uow.accounts.delete_if_no_transactions.return_value = False
 
-        result = asyncio.run(service.delete_account(account.id))
+        result = asyncio.run(service.delete_account(account_id))
 
         assert isinstance(result, AccountError)
         assert result.code == "HAS_TRANSACTIONS"
         assert "Close it instead" in result.message
-        mock_uow.accounts.delete.assert_not_called()
+        mock_uow.collect_events.assert_not_called()
         mock_uow.commit.assert_not_called()
 
 
@@ -1,7 +1,8 @@
 """Tests for AuthService application service."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestAuthServiceRegister:
@@ -9,6 +10,7 @@ class TestAuthServiceRegister:
 
     def test_register_creates_user_and_household(self) -> None:
         """register() creates User and Household, returns RegistrationResult."""
+        from src.adapters.security.tokens import verify_email_token
         from src.application.services.auth_service import (
             AuthService,
             RegistrationResult,
@@ -28,7 +30,7 @@ class TestAuthServiceRegister:
         assert isinstance(result, RegistrationResult)
         assert result.user.email == "new@example.com"
         assert result.household.name == "New User's Household"
-        assert result.verification_token is not None
+        assert verify_email_token(result.verification_token) == "new@example.com"
 
     def test_register_normalizes_email(self) -> None:
         """register() lowercases email."""
@@ -51,6 +53,27 @@ class TestAuthServiceRegister:
         assert isinstance(result, RegistrationResult)
         assert result.user.email == "test@example.com"
 
+    def test_register_strips_whitespace_from_lowercase_email(self) -> None:
+        """register() strips surrounding whitespace from the email."""
+        from src.application.services.auth_service import (
+            AuthService,
+            RegistrationResult,
+        )
+
+        uow = self._make_mock_uow(existing_email=None)
+        service = AuthService(uow)
+
+        result = asyncio.run(
+            service.register(
+                email="  test@example.com\n",
+                password="Test123!@",
+                display_name="Test",
+            )
+        )
+
+        assert isinstance(result, RegistrationResult)
+        assert result.user.email == "test@example.com"
+
     def test_register_duplicate_email_returns_error(self) -> None:
         """register() returns AuthError when email already exists."""
         from src.application.services.auth_service import AuthError, AuthService
@@ -169,6 +192,45 @@ class TestAuthServiceLogin:
         assert isinstance(result, AuthError)
         assert result.code == "INVALID_CREDENTIALS"
 
+    def test_login_nonexistent_email_still_verifies_password(self) -> None:
+        """login() runs Argon2 for unknown emails so timing matches."""
+        from src.application.services import auth_service
+        from src.application.services.auth_service import AuthError, AuthService
+
+        uow = self._make_mock_uow_with_user(email=None)
+        service = AuthService(uow)
+
+        with patch.object(
+            auth_service, "verify_password", wraps=auth_service.verify_password
+        ) as verify:
+            result = asyncio.run(service.login("nobody@example.com", "SomePass123!"))
+
+        assert isinstance(result, AuthError)
+        assert result.code == "INVALID_CREDENTIALS"
+        verify.assert_called_once()
+        password, hashed = verify.call_args.args
+        assert password == "SomePass123!"
+        assert hashed.startswith("$argon2id$")
+
+    def test_login_wrong_password_unverified_returns_invalid_credentials(
+        self,
+    ) -> None:
+        """login() doesn't reveal verification status without a valid password."""
+        from src.adapters.security.password import hash_password
+        from src.application.services.auth_service import AuthError, AuthService
+
+        uow = self._make_mock_uow_with_user(
+            email="user@example.com",
+            password_hash=hash_password("ValidPass123!"),
+            email_verified=False,
+        )
+        service = AuthService(uow)
+
+        result = asyncio.run(service.login("user@example.com", "WrongPass123!"))
+
+        assert isinstance(result, AuthError)
+        assert result.code == "INVALID_CREDENTIALS"
+
     def test_login_unverified_email_returns_error(self) -> None:
         """login() returns AuthError if email not verified."""
         from src.adapters.security.password import hash_password
@@ -219,6 +281,57 @@ class TestAuthServiceLogin:
         return uow
 
 
+class TestAuthServiceRefresh:
+    """Tests for AuthService.refresh() method."""
+
+    def test_refresh_uses_household_from_rotation(self) -> None:
+        """refresh() builds the access token without a separate user lookup."""
+        from domain.model.entity_id import HouseholdId, UserId
+        from src.adapters.security.jwt import decode_access_token
+        from src.application.services.auth_service import AuthService, AuthTokens
+
+        user_id = UserId.generate()
+        household_id = HouseholdId.generate()
+        record = MagicMock()
+        record.user_id = str(user_id)
+
+        uow = MagicMock()
+        uow.__enter__ = MagicMock(return_value=uow)
+        uow.__exit__ = MagicMock(return_value=False)
+        uow.refresh_tokens.validate_and_rotate.return_value = (
+            "new_raw_token",
+            record,
+            household_id,
+        )
+        uow.commit = AsyncMock()
+
+        result = asyncio.run(AuthService(uow).refresh("old_raw_token"))
+
+        assert isinstance(result, AuthTokens)
+        assert result.refresh_token == "new_raw_token"
+        claims = decode_access_token(result.access_token)
+        assert claims["sub"] == str(user_id)
+        assert claims["household_id"] == str(household_id)
+        uow.users.get_by_id.assert_not_called()
+
+    def test_invalid_refresh_token_returns_error(self) -> None:
+        """refresh() returns AuthError when rotation rejects the token."""
+        from src.application.services.auth_service import AuthError, AuthService
+
+        uow = MagicMock()
+        uow.__enter__ = MagicMock(return_value=uow)
+        uow.__exit__ = MagicMock(return_value=False)
+        uow.refresh_tokens.validate_and_rotate.return_value = None
+        uow.commit = AsyncMock()
+
+        result = asyncio.run(AuthService(uow).refresh("stale_token"))
+
+        assert isinstance(result, AuthError)
+        assert result.code == "INVALID_REFRESH_TOKEN"
+        # Committed so a reuse-triggered family revocation persists
+        uow.commit.assert_awaited_once()
+
+
 class TestAuthServiceVerifyEmail:
     """Tests for AuthService.verify_email() method."""
 
@@ -246,6 +359,31 @@ class TestAuthServiceVerifyEmail:
         assert not isinstance(result, type(None))
         assert hasattr(result, "email_verified")
 
+    def test_valid_token_evicts_cached_profile(self) -> None:
+        """verify_email() drops the user's cached profile after commit."""
+        from domain.model.household import Household
+        from domain.model.user import User
+        from src.adapters.security.tokens import generate_verification_token
+        from src.application.services.auth_service import AuthService
+
+        token = generate_verification_token("user@example.com")
+        household = Household.create("Test's Household")
+        user = User.create("user@example.com", "Test", "hash", household.id)
+
+        uow = MagicMock()
+        uow.__enter__ = MagicMock(return_value=uow)
+        uow.__exit__ = MagicMock(return_value=False)
+        uow.users.get_by_email.return_value = user
+        uow.users.get_with_household.return_value = (user, household)
+        uow.commit = AsyncMock()
+        service = AuthService(uow)
+        service.get_user_profile(user.id)  # primes the cache
+
+        asyncio.run(service.verify_email(token))
+        service.get_user_profile(user.id)
+
+        assert uow.users.get_with_household.call_count == 2
+
     def test_invalid_token_returns_error(self) -> None:
         """verify_email() returns AuthError for invalid token."""
         from src.application.services.auth_service import AuthError, AuthService
@@ -257,3 +395,84 @@ class TestAuthServiceVerifyEmail:
 
         assert isinstance(result, AuthError)
         assert result.code == "INVALID_VERIFICATION_TOKEN"
+
+
+class TestAuthServiceGetUserProfile:
+    """Tests for AuthService.get_user_profile() method."""
+
+    def test_second_call_is_served_from_cache(self) -> None:
+        """get_user_profile() doesn't hit the repositories on a cache hit."""
+        from src.application.services.auth_service import AuthService
+
+        uow, user, household = self._make_mock_uow()
+        service = AuthService(uow)
+
+        first = service.get_user_profile(user.id)
+        second = service.get_user_profile(user.id)
+
+        assert first == (user, household)
+        assert second == first
+        uow.users.get_with_household.assert_called_once_with(user.id)
+
+    def test_uses_readonly_unit_of_work(self) -> None:
+        """get_user_profile() reads outside a write transaction."""
+        from src.application.services.auth_service import AuthService
+
+        uow, user, _household = self._make_mock_uow()
+
+        AuthService(uow).get_user_profile(user.id)
+
+        uow.readonly.assert_called_once_with()
+        uow.__enter__.assert_not_called()
+
+    def test_missing_user_is_not_cached(self) -> None:
+        """get_user_profile() looks up unknown users again on the next call."""
+        from domain.model.entity_id import UserId
+        from src.application.services.auth_service import AuthService
+
+        uow = MagicMock()
+        uow.__enter__ = MagicMock(return_value=uow)
+        uow.__exit__ = MagicMock(return_value=False)
+        uow.users.get_with_household.return_value = None
+        service = AuthService(uow)
+        user_id = UserId.generate()
+
+        assert service.get_user_profile(user_id) is None
+        assert service.get_user_profile(user_id) is None
+        assert uow.users.get_with_household.call_count == 2
+
+    def test_expired_entry_is_reloaded(self) -> None:
+        """get_user_profile() reloads once the cached entry's TTL has passed."""
+        from src.application.services import auth_service
+        from src.application.services.auth_service import AuthService
+
+        uow, user, _household = self._make_mock_uow()
+        service = AuthService(uow)
+
+        service.get_user_profile(user.id)
+        with patch.object(
+            auth_service.time,
+            "monotonic",
+            return_value=auth_service.time.monotonic()
+            + auth_service.PROFILE_CACHE_TTL_SECONDS
+            + 1,
+        ):
+            service.get_user_profile(user.id)
+
+        assert uow.users.get_with_household.call_count == 2
+
+    @staticmethod
+    def _make_mock_uow() -> tuple[MagicMock, Any, Any]:
+        """Create mock UnitOfWork returning a fresh user and household."""
+        from domain.model.household import Household
+        from domain.model.user import User
+
+        household = Household.create("Test's Household")
+        user = User.create("user@example.com", "Test", "hash", household.id)
+
+        uow = MagicMock()
+        uow.__enter__ = MagicMock(return_value=uow)
+        uow.__exit__ = MagicMock(return_value=False)
+        uow.users.get_with_household.return_value = (user, household)
+
+        return uow, user, household
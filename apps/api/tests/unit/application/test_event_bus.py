@@ -134,6 +134,68 @@ class TestPublish:
         with pytest.raises(ValueError, match="Handler failed intentionally"):
             asyncio.run(event_bus.publish(SampleEvent(value="test")))
 
+    def test_async_handlers_run_concurrently(self):
+        """Async handlers for one event overlap rather than run serially."""
+        started = asyncio.Event()
+        calls: list[str] = []
+
+        async def waiting_handler(event: SampleEvent) -> None:
+            # Would block forever if handlers were awaited one at a time
+            await asyncio.wait_for(started.wait(), timeout=1)
+            calls.append("waiting")
+
+        async def starting_handler(event: SampleEvent) -> None:
+            started.set()
+            calls.append("starting")
+
+        event_bus.register(SampleEvent, waiting_handler)
+        event_bus.register(SampleEvent, starting_handler)
+
+        asyncio.run(event_bus.publish(SampleEvent(value="test")))
+
+        assert sorted(calls) == ["starting", "waiting"]
+
+    def test_sync_handlers_run_before_async_handlers(self):
+        """Sync handlers run in registration order ahead of any async one."""
+        calls: list[str] = []
+
+        async def first_async(event: SampleEvent) -> None:
+            calls.append("async")
+
+        def first_sync(event: SampleEvent) -> None:
+            calls.append("sync-1")
+
+        async def second_async(event: SampleEvent) -> None:
+            calls.append("async")
+
+        def second_sync(event: SampleEvent) -> None:
+            calls.append("sync-2")
+
+        event_bus.register(SampleEvent, first_async)
+        event_bus.register(SampleEvent, first_sync)
+        event_bus.register(SampleEvent, second_async)
+        event_bus.register(SampleEvent, second_sync)
+
+        asyncio.run(event_bus.publish(SampleEvent(value="test")))
+
+        assert calls == ["sync-1", "sync-2", "async", "async"]
+
+    def test_async_handler_exception_propagates(self):
+        """Exception from an async handler is re-raised after logging."""
+
+        async def failing_handler(event: SampleEvent) -> None:
+            msg = "Async handler failed"
+            raise ValueError(msg)
+
+        async def other_handler(event: SampleEvent) -> None:
+            pass
+
+        event_bus.register(SampleEvent, failing_handler)
+        event_bus.register(SampleEvent, other_handler)
+
+        with pytest.raises(ValueError, match="Async handler failed"):
+            asyncio.run(event_bus.publish(SampleEvent(value="test")))
+
 
 class TestPublishAll:
     """Tests for event_bus.publish_all()."""
@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from domain.events.base import DomainEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountCreated(DomainEvent):
     """Emitted when a new account is created.
 
@@ -25,7 +25,7 @@ class AccountCreated(DomainEvent):
     account_type: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountUpdated(DomainEvent):
     """Emitted when account properties change.
 
@@ -40,7 +40,7 @@ class AccountUpdated(DomainEvent):
     new_value: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountClosed(DomainEvent):
     """Emitted when an account is closed.
 
@@ -49,7 +49,7 @@ class AccountClosed(DomainEvent):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountReopened(DomainEvent):
     """Emitted when a closed account is reopened.
 
@@ -58,7 +58,7 @@ class AccountReopened(DomainEvent):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountDeleted(DomainEvent):
     """Emitted when an account without transactions is deleted.
 
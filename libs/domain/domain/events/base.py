@@ -12,12 +12,13 @@ Events are immutable records of facts. They capture:
 - Event-specific data (subclass fields)
 """
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
-from typing import Any
+from functools import partial
+from typing import Any, ClassVar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
     """Base class for all domain events.
 
@@ -30,34 +31,47 @@ class DomainEvent:
         occurred_at: UTC timestamp when the event occurred.
 
     Example:
-        @dataclass(frozen=True)
+        @dataclass(frozen=True, slots=True)
         class AccountCreated(DomainEvent):
             account_name: str
             initial_balance: Decimal
     """
 
+    # Event type name (class name), used for serialization and event routing.
+    # Set per subclass so reads are a plain class attribute lookup.
+    event_type: ClassVar[str] = "DomainEvent"
+
+    # Field names in declaration order, resolved once per class by to_dict()
+    _field_names: ClassVar[tuple[str, ...] | None] = None
+
     aggregate_id: str
     aggregate_type: str
-    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    occurred_at: datetime = field(default_factory=partial(datetime.now, UTC))
 
-    @property
-    def event_type(self) -> str:
-        """Return the event type name (class name).
-
-        Used for serialization and event routing.
-        """
-        return self.__class__.__name__
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Explicit form: slots=True makes @dataclass rebuild the class, which
+        # leaves zero-argument super() bound to the discarded original
+        super(DomainEvent, cls).__init_subclass__(**kwargs)
+        cls.event_type = cls.__name__
+        # @dataclass hasn't processed the subclass yet, so its fields are
+        # looked up lazily on the first to_dict() call
+        cls._field_names = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert event to dictionary for serialization.
 
-        Handles datetime conversion to ISO format string.
+        Handles datetime conversion to ISO format string. Event fields are
+        flat primitives, so values are copied directly instead of through
+        dataclasses.asdict()'s recursive deep copy.
 
         Returns:
             Dictionary representation of the event.
         """
-        result = asdict(self)
+        cls = type(self)
+        names = cls._field_names
+        if names is None:
+            names = cls._field_names = tuple(f.name for f in fields(cls))
+        result = {name: getattr(self, name) for name in names}
         # Convert datetime to ISO format string for JSON serialization
-        if isinstance(result.get("occurred_at"), datetime):
-            result["occurred_at"] = result["occurred_at"].isoformat()
+        result["occurred_at"] = self.occurred_at.isoformat()
         return result
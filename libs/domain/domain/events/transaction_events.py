@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from domain.events.base import DomainEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionCreated(DomainEvent):
     """Emitted when a new transaction is created.
 
@@ -32,7 +32,7 @@ class TransactionCreated(DomainEvent):
     is_mirror: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionUpdated(DomainEvent):
     """Emitted when transaction fields are modified.
 
@@ -47,7 +47,7 @@ class TransactionUpdated(DomainEvent):
     new_value: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionDeleted(DomainEvent):
     """Emitted when a transaction is deleted.
 
@@ -58,7 +58,7 @@ class TransactionDeleted(DomainEvent):
     was_mirror: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionStatusChanged(DomainEvent):
     """Emitted when transaction status changes (Pending -> Cleared -> Reconciled).
 
@@ -71,7 +71,7 @@ class TransactionStatusChanged(DomainEvent):
     new_status: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SplitUpdated(DomainEvent):
     """Emitted when transaction splits are modified.
 
@@ -84,7 +84,7 @@ class SplitUpdated(DomainEvent):
     split_count: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MirrorTransactionCreated(DomainEvent):
     """Emitted when a mirror transaction is auto-created for a transfer.
 
@@ -101,7 +101,7 @@ class MirrorTransactionCreated(DomainEvent):
     target_account_id: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MirrorTransactionDeleted(DomainEvent):
     """Emitted when a mirror transaction is deleted (transfer split removed).
 
@@ -114,7 +114,7 @@ class MirrorTransactionDeleted(DomainEvent):
     mirror_transaction_id: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryCreated(DomainEvent):
     """Emitted when a new category is created.
 
@@ -129,7 +129,7 @@ class CategoryCreated(DomainEvent):
     is_system: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryUpdated(DomainEvent):
     """Emitted when a category is modified.
 
@@ -144,7 +144,7 @@ class CategoryUpdated(DomainEvent):
     new_value: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryDeleted(DomainEvent):
     """Emitted when a category is deleted.
 
@@ -153,7 +153,7 @@ class CategoryDeleted(DomainEvent):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PayeeCreated(DomainEvent):
     """Emitted when a new payee is auto-created.
 
@@ -164,7 +164,7 @@ class PayeeCreated(DomainEvent):
     payee_name: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PayeeUpdated(DomainEvent):
     """Emitted when a payee is modified.
 
@@ -179,7 +179,7 @@ class PayeeUpdated(DomainEvent):
     new_value: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PayeeDeleted(DomainEvent):
     """Emitted when a payee is deleted.
 
@@ -11,6 +11,7 @@ User events are collected via the aggregate's collect_events() method.
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import partial
 
 
 @dataclass(frozen=True, slots=True)
@@ -27,7 +28,7 @@ class UserRegistered:
     user_id: str
     email: str
     household_id: str
-    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    occurred_at: datetime = field(default_factory=partial(datetime.now, UTC))
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,4 +43,4 @@ class EmailVerified:
 
     user_id: str
     email: str
-    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    occurred_at: datetime = field(default_factory=partial(datetime.now, UTC))
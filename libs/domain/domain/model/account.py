@@ -23,7 +23,12 @@ from domain.events.account_events import (
     AccountUpdated,
 )
 from domain.events.base import DomainEvent
-from domain.model.account_types import AccountStatus, AccountSubtype, AccountType
+from domain.model.account_types import (
+    IRA_SUBTYPES,
+    AccountStatus,
+    AccountSubtype,
+    AccountType,
+)
 from domain.model.entity_id import AccountId, HouseholdId, UserId
 from domain.model.institution import InstitutionDetails
 from domain.model.money import Money
@@ -91,6 +96,15 @@ class Account:
         """Clear collected events after processing."""
         self._events.clear()
 
+    def drain_events(self) -> list[DomainEvent]:
+        """Hand over collected events and start a fresh list.
+
+        Equivalent to reading events then calling clear_events(), without
+        copying the list.
+        """
+        events, self._events = self._events, []
+        return events
+
     @property
     def is_active(self) -> bool:
         """Check if account is active."""
@@ -317,15 +331,10 @@ class Account:
     ) -> Self:
         """Factory for IRA account with optional IRA-specific subtype."""
         # Validate subtype is IRA-related if provided
-        ira_subtypes = {
-            AccountSubtype.TRADITIONAL_IRA,
-            AccountSubtype.ROTH_IRA,
-            AccountSubtype.SEP_IRA,
-        }
-        if subtype is not None and subtype not in ira_subtypes:
+        if subtype is not None and subtype not in IRA_SUBTYPES:
             raise ValueError(
                 f"Invalid IRA subtype: {subtype}. "
-                f"Must be one of: {', '.join(s.value for s in ira_subtypes)}"
+                f"Must be one of: {', '.join(sorted(IRA_SUBTYPES))}"
             )
 
         account = cls(
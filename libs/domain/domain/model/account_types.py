@@ -6,7 +6,8 @@ Provides type-safe string enums for account classification:
 - AccountSubtype: Optional subtypes for type-specific domain logic
 
 All enums use StrEnum (Python 3.11+) for direct string comparison
-and JSON-friendly serialization.
+and JSON-friendly serialization. Members are str instances, so
+comparisons against them are plain string comparisons.
 """
 
 from enum import StrEnum, auto
@@ -56,3 +57,13 @@ class AccountSubtype(StrEnum):
     AUTO_LOAN = auto()
     PERSONAL_LOAN = auto()
     LINE_OF_CREDIT = auto()
+
+
+# Subtypes accepted by Account.create_ira(), built once for membership checks
+IRA_SUBTYPES: frozenset[AccountSubtype] = frozenset(
+    {
+        AccountSubtype.TRADITIONAL_IRA,
+        AccountSubtype.ROTH_IRA,
+        AccountSubtype.SEP_IRA,
+    }
+)
@@ -18,10 +18,50 @@ Key benefits:
 """
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
 
+import re
 from dataclasses import dataclass
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
+import uuid_utils
 from typeid import TypeID
+from typeid.codecs.base32 import encode as _encode_suffix
+
+# TypeID suffix: 26 lowercase Crockford base32 characters encoding a 128-bit
+# UUID, so the first character is at most "7".
+_SUFFIX_RE = re.compile(r"[0-7][0-9a-hjkmnp-tv-z]{25}")
+
+
+def _new_value(prefix: str) -> str:
+    """Return a new "<prefix>_<suffix>" string for a known-valid prefix.
+
+    Same UUID7 and base32 codec TypeID uses internally, minus the TypeID
+    object, its prefix validation and string formatting.
+    """
+    return f"{prefix}_{_encode_suffix(uuid_utils.uuid7().bytes)}"
+
+
+def _validate_prefixed(value: str, prefix: str) -> None:
+    """Validate that value is a TypeID string with the given prefix.
+
+    Well-formed IDs are checked with a prefix comparison and one regex match,
+    without building (and base32-decoding) a TypeID. Anything else goes
+    through TypeID.from_string() so malformed input raises the same errors
+    as before.
+
+    Raises:
+        ValueError: If the prefix doesn't match.
+        TypeIDException: If the value isn't a valid TypeID.
+    """
+    end = len(prefix)
+    if (
+        value.startswith(prefix)
+        and value[end : end + 1] == "_"
+        and _SUFFIX_RE.fullmatch(value, end + 1)
+    ):
+        return
+    tid: Any = TypeID.from_string(value)
+    if tid.prefix != prefix:
+        raise ValueError(f"Expected '{prefix}' prefix, got '{tid.prefix}'")
 
 
 @dataclass(frozen=True, slots=True)
@@ -70,7 +110,9 @@ class EntityId:
     @property
     def prefix(self) -> str:
         """Extract the prefix from the ID value."""
-        return self.value.split("_")[0]
+        # Slice up to the first separator rather than split() into a list
+        end = self.value.find("_")
+        return self.value if end == -1 else self.value[:end]
 
     def __str__(self) -> str:
         """Return the full ID string for easy serialization."""
@@ -86,11 +128,12 @@ class AccountId:
 
     value: str
 
+    prefix: ClassVar[str] = "acct"
+
     @classmethod
     def generate(cls) -> Self:
         """Generate a new AccountId."""
-        tid = TypeID(prefix="acct")
-        return cls(value=str(tid))
+        return cls(value=_new_value(cls.prefix))
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -105,16 +148,9 @@ class AccountId:
         Raises:
             ValueError: If ID format is invalid or prefix doesn't match.
         """
-        tid: Any = TypeID.from_string(value)
-        if tid.prefix != "acct":
-            raise ValueError(f"Expected 'acct' prefix, got '{tid.prefix}'")
+        _validate_prefixed(value, cls.prefix)
         return cls(value=value)
 
-    @property
-    def prefix(self) -> str:
-        """Return the prefix (always 'acct')."""
-        return "acct"
-
     def __str__(self) -> str:
         """Return the full ID string."""
         return self.value
@@ -129,11 +165,12 @@ class TransactionId:
 
     value: str
 
+    prefix: ClassVar[str] = "txn"
+
     @classmethod
     def generate(cls) -> Self:
         """Generate a new TransactionId."""
-        tid = TypeID(prefix="txn")
-        return cls(value=str(tid))
+        return cls(value=_new_value(cls.prefix))
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -148,16 +185,9 @@ class TransactionId:
         Raises:
             ValueError: If ID format is invalid or prefix doesn't match.
         """
-        tid: Any = TypeID.from_string(value)
-        if tid.prefix != "txn":
-            raise ValueError(f"Expected 'txn' prefix, got '{tid.prefix}'")
+        _validate_prefixed(value, cls.prefix)
         return cls(value=value)
 
-    @property
-    def prefix(self) -> str:
-        """Return the prefix (always 'txn')."""
-        return "txn"
-
     def __str__(self) -> str:
         """Return the full ID string."""
         return self.value
@@ -172,11 +202,12 @@ class UserId:
 
     value: str
 
+    prefix: ClassVar[str] = "user"
+
     @classmethod
     def generate(cls) -> Self:
         """Generate a new UserId."""
-        tid = TypeID(prefix="user")
-        return cls(value=str(tid))
+        return cls(value=_new_value(cls.prefix))
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -191,16 +222,9 @@ class UserId:
         Raises:
             ValueError: If ID format is invalid or prefix doesn't match.
         """
-        tid: Any = TypeID.from_string(value)
-        if tid.prefix != "user":
-            raise ValueError(f"Expected 'user' prefix, got '{tid.prefix}'")
+        _validate_prefixed(value, cls.prefix)
         return cls(value=value)
 
-    @property
-    def prefix(self) -> str:
-        """Return the prefix (always 'user')."""
-        return "user"
-
     def __str__(self) -> str:
         """Return the full ID string."""
         return self.value
@@ -215,11 +239,12 @@ class HouseholdId:
 
     value: str
 
+    prefix: ClassVar[str] = "hh"
+
     @classmethod
     def generate(cls) -> Self:
         """Generate a new HouseholdId."""
-        tid = TypeID(prefix="hh")
-        return cls(value=str(tid))
+        return cls(value=_new_value(cls.prefix))
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -234,16 +259,9 @@ class HouseholdId:
         Raises:
             ValueError: If ID format is invalid or prefix doesn't match.
         """
-        tid: Any = TypeID.from_string(value)
-        if tid.prefix != "hh":
-            raise ValueError(f"Expected 'hh' prefix, got '{tid.prefix}'")
+        _validate_prefixed(value, cls.prefix)
         return cls(value=value)
 
-    @property
-    def prefix(self) -> str:
-        """Return the prefix (always 'hh')."""
-        return "hh"
-
     def __str__(self) -> str:
         """Return the full ID string."""
         return self.value
@@ -258,11 +276,12 @@ class CategoryId:
 
     value: str
 
+    prefix: ClassVar[str] = "cat"
+
     @classmethod
     def generate(cls) -> Self:
         """Generate a new CategoryId."""
-        tid = TypeID(prefix="cat")
-        return cls(value=str(tid))
+        return cls(value=_new_value(cls.prefix))
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -277,16 +296,9 @@ class CategoryId:
         Raises:
             ValueError: If ID format is invalid or prefix doesn't match.
         """
-        tid: Any = TypeID.from_string(value)
-        if tid.prefix != "cat":
-            raise ValueError(f"Expected 'cat' prefix, got '{tid.prefix}'")
+        _validate_prefixed(value, cls.prefix)
         return cls(value=value)
 
-    @property
-    def prefix(self) -> str:
-        """Return the prefix (always 'cat')."""
-        return "cat"
-
     def __str__(self) -> str:
         """Return the full ID string."""
         return self.value
@@ -301,11 +313,12 @@ class BudgetId:
 
     value: str
 
+    prefix: ClassVar[str] = "budg"
+
     @classmethod
     def generate(cls) -> Self:
         """Generate a new BudgetId."""
-        tid = TypeID(prefix="budg")
-        return cls(value=str(tid))
+        return cls(value=_new_value(cls.prefix))
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -320,16 +333,9 @@ class BudgetId:
         Raises:
             ValueError: If ID format is invalid or prefix doesn't match.
         """
-        tid: Any = TypeID.from_string(value)
-        if tid.prefix != "budg":
-            raise ValueError(f"Expected 'budg' prefix, got '{tid.prefix}'")
+        _validate_prefixed(value, cls.prefix)
         return cls(value=value)
 
-    @property
-    def prefix(self) -> str:
-        """Return the prefix (always 'budg')."""
-        return "budg"
-
     def __str__(self) -> str:
         """Return the full ID string."""
         return self.value
@@ -344,11 +350,12 @@ class PayeeId:
 
     value: str
 
+    prefix: ClassVar[str] = "payee"
+
     @classmethod
     def generate(cls) -> Self:
         """Generate a new PayeeId."""
-        tid = TypeID(prefix="payee")
-        return cls(value=str(tid))
+        return cls(value=_new_value(cls.prefix))
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -363,16 +370,9 @@ class PayeeId:
         Raises:
             ValueError: If ID format is invalid or prefix doesn't match.
         """
-        tid: Any = TypeID.from_string(value)
-        if tid.prefix != "payee":
-            raise ValueError(f"Expected 'payee' prefix, got '{tid.prefix}'")
+        _validate_prefixed(value, cls.prefix)
         return cls(value=value)
 
-    @property
-    def prefix(self) -> str:
-        """Return the prefix (always 'payee')."""
-        return "payee"
-
     def __str__(self) -> str:
         """Return the full ID string."""
         return self.value
@@ -387,11 +387,12 @@ class SplitId:
 
     value: str
 
+    prefix: ClassVar[str] = "split"
+
     @classmethod
     def generate(cls) -> Self:
         """Generate a new SplitId."""
-        tid = TypeID(prefix="split")
-        return cls(value=str(tid))
+        return cls(value=_new_value(cls.prefix))
 
     @classmethod
     def from_string(cls, value: str) -> Self:
@@ -406,16 +407,9 @@ class SplitId:
         Raises:
             ValueError: If ID format is invalid or prefix doesn't match.
         """
-        tid: Any = TypeID.from_string(value)
-        if tid.prefix != "split":
-            raise ValueError(f"Expected 'split' prefix, got '{tid.prefix}'")
+        _validate_prefixed(value, cls.prefix)
         return cls(value=value)
 
-    @property
-    def prefix(self) -> str:
-        """Return the prefix (always 'split')."""
-        return "split"
-
     def __str__(self) -> str:
         """Return the full ID string."""
         return self.value
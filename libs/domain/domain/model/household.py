@@ -37,16 +37,20 @@ class Household:
     def create(
         cls,
         name: str,
+        now: datetime | None = None,
     ) -> Self:
         """Create a new household.
 
         Args:
             name: Display name for the household
+            now: Creation timestamp; batch callers can share one value.
+                Defaults to the current UTC time.
 
         Returns:
             New Household instance with generated ID
         """
-        now = datetime.now(UTC)
+        if now is None:
+            now = datetime.now(UTC)
         return cls(
             id=HouseholdId.generate(),
             name=name,
@@ -54,7 +58,14 @@ class Household:
             updated_at=now,
         )
 
-    def update_name(self, name: str) -> None:
-        """Update household display name."""
+    def update_name(self, name: str, now: datetime | None = None) -> None:
+        """Update household display name.
+
+        Args:
+            name: New display name for the household
+            now: Modification timestamp. Defaults to the current UTC time.
+        """
+        if now is None:
+            now = datetime.now(UTC)
         self.name = name
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = now
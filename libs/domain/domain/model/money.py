@@ -10,6 +10,8 @@ Key design decisions:
 - Immutable via frozen dataclass
 - Rejects operations between different currencies
 - Always initialize Decimal from string to avoid float precision issues
+- Sums, differences, negations and absolute values of normalized amounts
+  are already at 4 decimal places, so those results skip re-normalization
 """
 
 from __future__ import annotations
@@ -17,8 +19,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 
+_QUANTUM = Decimal("0.0001")
 
-@dataclass(frozen=True, slots=True)
+# Currency codes already validated -> uppercase form. Real data uses a
+# handful of ISO codes; the size cap keeps arbitrary input from growing it.
+_CURRENCY_CODES: dict[str, str] = {}
+_CURRENCY_CODES_MAX = 512
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Money:
     """Immutable value object for monetary amounts with precision arithmetic.
 
@@ -37,23 +46,47 @@ class Money:
     amount: Decimal
     currency: str = "USD"
 
-    def __post_init__(self) -> None:
-        """Normalize amount to 4 decimal places and validate currency."""
-        # Normalize to 4 decimal places for consistent precision
+    def __init__(self, amount: Decimal, currency: str = "USD") -> None:
+        """Normalize amount to 4 decimal places and validate currency.
+
+        Hand-written rather than generated so each field is stored once,
+        already normalized; a generated __init__ plus __post_init__ would
+        go through the frozen object.__setattr__ path twice per field.
+        """
+        # Normalize to 4 decimal places for consistent precision.
+        # Only non-Decimal input goes through str() (avoids float artifacts);
+        # Decimals are quantized directly, no format/reparse round trip.
+        if type(amount) is not Decimal:
+            amount = Decimal(str(amount))
         # Use object.__setattr__ because frozen=True blocks normal assignment
-        normalized = Decimal(str(self.amount)).quantize(
-            Decimal("0.0001"), rounding=ROUND_HALF_UP
+        object.__setattr__(
+            self, "amount", amount.quantize(_QUANTUM, rounding=ROUND_HALF_UP)
         )
-        object.__setattr__(self, "amount", normalized)
 
-        # Validate currency is 3-letter ISO code
-        if len(self.currency) != 3 or not self.currency.isalpha():
-            raise ValueError(
-                f"Currency must be 3-letter ISO code, got: {self.currency}"
-            )
-
-        # Normalize currency to uppercase
-        object.__setattr__(self, "currency", self.currency.upper())
+        code = _CURRENCY_CODES.get(currency)
+        if code is None:
+            # Validate currency is 3-letter ISO code
+            if len(currency) != 3 or not currency.isalpha():
+                raise ValueError(f"Currency must be 3-letter ISO code, got: {currency}")
+
+            # Normalize currency to uppercase
+            code = currency.upper()
+            if len(_CURRENCY_CODES) < _CURRENCY_CODES_MAX:
+                _CURRENCY_CODES[currency] = code
+        object.__setattr__(self, "currency", code)
+
+    @classmethod
+    def _exact(cls, amount: Decimal, currency: str) -> Money:
+        """Build Money from a 4-decimal-place amount, skipping __init__.
+
+        Only for results of operations that are closed over normalized
+        amounts (add, subtract, negate, abs) with an already validated,
+        uppercased currency.
+        """
+        money = object.__new__(cls)
+        object.__setattr__(money, "amount", amount)
+        object.__setattr__(money, "currency", currency)
+        return money
 
     def __composite_values__(self) -> tuple[Decimal, str]:
         """Return flat column values for SQLAlchemy composite() mapping."""
@@ -79,7 +112,7 @@ class Money:
             ValueError: If currencies don't match.
         """
         self._check_same_currency(other)
-        return Money(self.amount + other.amount, self.currency)
+        return Money._exact(self.amount + other.amount, self.currency)
 
     def __sub__(self, other: Money) -> Money:
         """Subtract other from self (same currency).
@@ -94,7 +127,7 @@ class Money:
             ValueError: If currencies don't match.
         """
         self._check_same_currency(other)
-        return Money(self.amount - other.amount, self.currency)
+        return Money._exact(self.amount - other.amount, self.currency)
 
     def __mul__(self, factor: Decimal | int) -> Money:
         """Multiply by a factor (for percentage calculations, etc.).
@@ -117,7 +150,7 @@ class Money:
         Returns:
             New Money with negated amount.
         """
-        return Money(-self.amount, self.currency)
+        return Money._exact(-self.amount, self.currency)
 
     def __lt__(self, other: Money) -> bool:
         """Compare if self is less than other (same currency only).
@@ -173,4 +206,4 @@ class Money:
         Returns:
             New Money with absolute amount.
         """
-        return Money(abs(self.amount), self.currency)
+        return Money._exact(abs(self.amount), self.currency)
@@ -62,6 +62,7 @@ class Payee:
         name: str,
         default_category_id: CategoryId | None = None,
         household_id: HouseholdId | None = None,
+        now: datetime | None = None,
     ) -> Self:
         """Create a new payee with normalized name for matching.
 
@@ -69,6 +70,9 @@ class Payee:
             user_id: Owner of the payee.
             name: Display name (will be trimmed).
             default_category_id: Optional default category for auto-fill.
+            household_id: Owning household.
+            now: Creation timestamp. Bulk imports can pass one shared value
+                instead of reading the clock per payee. Defaults to now (UTC).
 
         Returns:
             New Payee instance.
@@ -80,6 +84,8 @@ class Payee:
         if not stripped_name:
             raise ValueError("Payee name cannot be empty")
 
+        if now is None:
+            now = datetime.now(UTC)
         return cls(
             id=PayeeId.generate(),
             user_id=user_id,
@@ -88,13 +94,16 @@ class Payee:
             name=stripped_name,
             normalized_name=stripped_name.lower(),
             default_category_id=default_category_id,
+            created_at=now,
+            updated_at=now,
         )
 
-    def update_name(self, new_name: str) -> None:
+    def update_name(self, new_name: str, now: datetime | None = None) -> None:
         """Update the payee name.
 
         Args:
             new_name: New display name for the payee.
+            now: Modification timestamp. Defaults to the current UTC time.
 
         Raises:
             ValueError: If new_name is empty or whitespace-only.
@@ -103,25 +112,37 @@ class Payee:
         if not stripped_name:
             raise ValueError("Payee name cannot be empty")
 
+        if now is None:
+            now = datetime.now(UTC)
         self.name = stripped_name
         self.normalized_name = stripped_name.lower()
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = now
 
-    def set_default_category(self, category_id: CategoryId | None) -> None:
+    def set_default_category(
+        self, category_id: CategoryId | None, now: datetime | None = None
+    ) -> None:
         """Set or clear the default category for auto-categorization.
 
         Args:
             category_id: Category to use as default, or None to clear.
+            now: Modification timestamp. Defaults to the current UTC time.
         """
+        if now is None:
+            now = datetime.now(UTC)
         self.default_category_id = category_id
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = now
 
-    def record_usage(self) -> None:
+    def record_usage(self, now: datetime | None = None) -> None:
         """Track that this payee was used in a transaction.
 
         Updates last_used_at and increments usage_count for
         sorting autocomplete by relevance.
+
+        Args:
+            now: Usage timestamp. Defaults to the current UTC time.
         """
-        self.last_used_at = datetime.now(UTC)
+        if now is None:
+            now = datetime.now(UTC)
+        self.last_used_at = now
         self.usage_count += 1
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = now
@@ -47,13 +47,15 @@ class SplitLine:
             ValueError: If split has both category and transfer account.
             ValueError: If transfer split amount is not negative.
         """
-        # Validate: must have either category OR transfer account (or neither for uncategorized)
-        if self.category_id is not None and self.transfer_account_id is not None:
-            raise ValueError("Split cannot have both category and transfer account")
-
-        # Transfer splits must be negative (outgoing from source account)
-        if self.transfer_account_id is not None and not self.amount.is_negative():
-            raise ValueError("Transfer split amount must be negative (outgoing)")
+        # Both rules only apply to transfers, so category/uncategorized splits
+        # (the bulk of any import) pass after a single check.
+        if self.transfer_account_id is not None:
+            # Must have either category OR transfer account (or neither)
+            if self.category_id is not None:
+                raise ValueError("Split cannot have both category and transfer account")
+            # Transfer splits must be negative (outgoing from source account)
+            if not self.amount.is_negative():
+                raise ValueError("Transfer split amount must be negative (outgoing)")
 
     @classmethod
     def create(
@@ -76,7 +76,7 @@ class User:
         now = datetime.now(UTC)
         user = cls(
             id=UserId.generate(),
-            email=email.lower().strip(),
+            email=email.strip().lower(),
             display_name=display_name.strip(),
             password_hash=password_hash,
             household_id=household_id,
@@ -127,10 +127,9 @@ class User:
     def collect_events(self) -> list[Any]:
         """Return and clear collected domain events.
 
-        Events are returned as a list and the internal list is cleared.
-        This follows the pattern where events are collected after
-        persistence to ensure they're only processed once.
+        Events are returned as a list and the internal list is replaced
+        with a fresh one (no copy). This follows the pattern where events
+        are collected after persistence to ensure they're only processed once.
         """
-        events = self._events.copy()
-        self._events.clear()
+        events, self._events = self._events, []
         return events
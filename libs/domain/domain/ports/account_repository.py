@@ -99,6 +99,26 @@ class AccountRepository(Protocol):
         """
         ...
 
+    def delete_if_no_transactions(
+        self,
+        account_id: AccountId,
+        household_id: HouseholdId | None = None,
+    ) -> bool | None:
+        """Delete an account in one step unless transactions reference it.
+
+        Combines get(), has_transactions() and delete() for callers that
+        don't need the loaded aggregate.
+
+        Args:
+            account_id: The account to delete.
+            household_id: Optional household the account must belong to.
+
+        Returns:
+            True if deleted, False if the account has transactions,
+            None if not found (or owned by another household).
+        """
+        ...
+
     def has_transactions(self, account_id: AccountId) -> bool:
         """Check if account has any transactions.
 
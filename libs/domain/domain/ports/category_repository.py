@@ -44,5 +44,9 @@ class CategoryRepository(Protocol):
         ...
 
     def count_transactions(self, category_id: CategoryId) -> int:
-        """Count transactions using this category (for deletion validation)."""
+        """Count transactions using this category."""
+        ...
+
+    def has_transactions(self, category_id: CategoryId) -> bool:
+        """Check if any transactions use this category (for deletion validation)."""
         ...
@@ -12,6 +12,8 @@ Key principles:
 - Events are collected and persisted to outbox on commit()
 """
 
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any, Protocol, Self
 
 if TYPE_CHECKING:
@@ -112,6 +114,17 @@ class UnitOfWork(Protocol):
         """
         ...
 
+    def readonly(self) -> AbstractContextManager[Self]:
+        """Enter the UoW context for queries only, without a transaction.
+
+        Use instead of ``with uow:`` for pure reads. Nothing may be
+        written or committed inside the block.
+
+        Returns:
+            Context manager yielding self.
+        """
+        ...
+
     async def commit(self) -> None:
         """Commit all changes to the database.
 
@@ -128,7 +141,7 @@ class UnitOfWork(Protocol):
         """
         ...
 
-    def collect_events(self, events: list["DomainEvent"]) -> None:
+    def collect_events(self, events: Iterable["DomainEvent"]) -> None:
         """Collect domain events for persistence to outbox.
 
         Events are written to the outbox table when commit() is called,
@@ -136,7 +149,8 @@ class UnitOfWork(Protocol):
         business data changes.
 
         Args:
-            events: List of domain events to persist.
+            events: Domain events to persist (e.g. an aggregate's drained
+                event list).
         """
         ...
 
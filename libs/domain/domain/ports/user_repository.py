@@ -8,6 +8,7 @@ adapters layer (UserRepository).
 from typing import Protocol
 
 from domain.model.entity_id import UserId
+from domain.model.household import Household
 from domain.model.user import User
 
 
@@ -37,6 +38,17 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
+    def get_with_household(self, user_id: UserId) -> tuple[User, Household] | None:
+        """Get user together with their household.
+
+        Args:
+            user_id: The user identifier.
+
+        Returns:
+            Tuple of (User, Household) if the user is found, None otherwise.
+        """
+        ...
+
     def get_by_email(self, email: str) -> User | None:
         """Get user by email address.
 
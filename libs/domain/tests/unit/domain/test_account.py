@@ -269,6 +269,20 @@ class TestAccountEventEmission:
         account.clear_events()
         assert len(account.events) == 0
 
+    def test_drain_events(self, user_id: UserId, usd_balance: Money):
+        """drain_events() returns the collected events and empties the list."""
+        account = Account.create_checking(
+            user_id=user_id,
+            name="Checking",
+            opening_balance=usd_balance,
+        )
+
+        drained = account.drain_events()
+
+        assert len(drained) == 1
+        assert isinstance(drained[0], AccountCreated)
+        assert account.events == []
+
 
 # --- Lifecycle Tests ---
 
@@ -10,6 +10,8 @@ Verifies that TypeID-based entity IDs:
 import time
 
 import pytest
+import uuid_utils
+from typeid.codecs.base32 import decode
 from typeid.errors import InvalidTypeIDStringException, SuffixValidationException
 
 from domain.model.entity_id import (
@@ -237,6 +239,13 @@ class TestEntityIdUniqueness:
         # Lexicographic sort should match creation order
         assert id1.value < id2.value
 
+    def test_generated_ids_are_uuid7_typeids(self):
+        """Generated values parse as TypeIDs wrapping a version 7 UUID."""
+        aid = AccountId.generate()
+        prefix, suffix = aid.value.split("_")
+        assert prefix == "acct"
+        assert uuid_utils.UUID(bytes=decode(suffix)).version == 7
+
 
 class TestEntityIdEdgeCases:
     """Tests for edge cases and error handling."""
@@ -253,6 +262,23 @@ class TestEntityIdEdgeCases:
         ):
             AccountId.from_string("not_a_valid_id")
 
+    def test_overflowing_suffix_rejected(self):
+        """A suffix starting above '7' (more than 128 bits) is rejected."""
+        with pytest.raises((ValueError, SuffixValidationException)):
+            AccountId.from_string("acct_8zzzzzzzzzzzzzzzzzzzzzzzzz")
+
+    def test_suffix_with_excluded_letter_rejected(self):
+        """Crockford base32 excludes 'i', 'l', 'o' and 'u'."""
+        aid = AccountId.generate()
+        with pytest.raises((ValueError, SuffixValidationException)):
+            AccountId.from_string(aid.value[:-1] + "u")
+
+    def test_truncated_suffix_rejected(self):
+        """A suffix shorter than 26 characters is rejected."""
+        aid = AccountId.generate()
+        with pytest.raises((ValueError, SuffixValidationException)):
+            AccountId.from_string(aid.value[:-1])
+
     def test_empty_string_rejected(self):
         """Empty string is rejected."""
         with pytest.raises((ValueError, TypeError, InvalidTypeIDStringException)):
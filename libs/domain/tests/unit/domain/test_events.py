@@ -0,0 +1,67 @@
+"""Tests for the DomainEvent base class."""
+
+from datetime import UTC, datetime
+
+from domain.events.account_events import AccountCreated
+from domain.events.base import DomainEvent
+from domain.events.transaction_events import TransactionCreated
+
+
+class TestDomainEvent:
+    """Tests for DomainEvent event_type and to_dict."""
+
+    def test_event_type_is_class_name(self) -> None:
+        """event_type is the concrete class name on both class and instance."""
+        event = AccountCreated(aggregate_id="acct_1", aggregate_type="Account")
+
+        assert AccountCreated.event_type == "AccountCreated"
+        assert event.event_type == "AccountCreated"
+        assert DomainEvent.event_type == "DomainEvent"
+
+    def test_to_dict_includes_all_fields_in_order(self) -> None:
+        """to_dict returns every field, with occurred_at as ISO 8601."""
+        occurred_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        event = TransactionCreated(
+            aggregate_id="txn_1",
+            aggregate_type="Transaction",
+            occurred_at=occurred_at,
+            account_id="acct_1",
+            amount="12.50",
+            is_mirror=True,
+        )
+
+        assert event.to_dict() == {
+            "aggregate_id": "txn_1",
+            "aggregate_type": "Transaction",
+            "occurred_at": "2026-01-02T03:04:05+00:00",
+            "account_id": "acct_1",
+            "amount": "12.50",
+            "currency": "USD",
+            "is_mirror": True,
+        }
+        assert list(event.to_dict()) == [
+            "aggregate_id",
+            "aggregate_type",
+            "occurred_at",
+            "account_id",
+            "amount",
+            "currency",
+            "is_mirror",
+        ]
+
+    def test_field_names_are_resolved_per_class(self) -> None:
+        """Each subclass caches its own field names."""
+        AccountCreated(aggregate_id="a", aggregate_type="Account").to_dict()
+        result = TransactionCreated(
+            aggregate_id="t", aggregate_type="Transaction"
+        ).to_dict()
+
+        assert "account_id" in result
+        assert "account_name" not in result
+
+    def test_events_use_slots(self) -> None:
+        """Events carry no per-instance __dict__."""
+        event = TransactionCreated(aggregate_id="t", aggregate_type="Transaction")
+
+        assert not hasattr(event, "__dict__")
+        assert TransactionCreated.event_type == "TransactionCreated"
@@ -8,6 +8,7 @@ Uses hypothesis to verify Money arithmetic properties:
 - Precision: No floating-point errors after operations
 """
 
+from dataclasses import FrozenInstanceError
 from decimal import Decimal
 
 import pytest
@@ -86,6 +87,21 @@ class TestMoneyProperties:
         halved = Money(doubled.amount / 2, "USD")
         assert m == halved
 
+    @given(a=money_amounts, b=money_amounts)
+    def test_closed_operations_stay_normalized(self, a: Decimal, b: Decimal):
+        """+, -, negation and abs match constructing Money from the result."""
+        m1 = Money(a, "USD")
+        m2 = Money(b, "USD")
+        for result, expected in (
+            (m1 + m2, a + b),
+            (m1 - m2, a - b),
+            (-m1, -a),
+            (m1.abs(), abs(a)),
+        ):
+            normalized = Money(expected, "USD")
+            assert result == normalized
+            assert str(result.amount) == str(normalized.amount)
+
 
 class TestMoneyValidation:
     """Tests for Money validation rules."""
@@ -130,6 +146,23 @@ class TestMoneyValidation:
         m = Money(Decimal("100"), "usd")
         assert m.currency == "USD"
 
+    def test_repeated_currency_codes_normalize_consistently(self):
+        """Cached currency codes give the same result as the first validation."""
+        first = Money(Decimal("1"), "gbp")
+        second = Money(Decimal("2"), "gbp")
+        assert first.currency == second.currency == "GBP"
+        with pytest.raises(ValueError, match=r"(?i)currency"):
+            Money(Decimal("1"), "gb1")
+        with pytest.raises(ValueError, match=r"(?i)currency"):
+            Money(Decimal("1"), "gb1")
+
+    def test_keyword_construction_and_immutability(self):
+        """Money accepts keyword arguments and rejects attribute assignment."""
+        m = Money(amount=Decimal("1.5"), currency="eur")
+        assert m == Money(Decimal("1.5000"), "EUR")
+        with pytest.raises(FrozenInstanceError):
+            m.amount = Decimal("2")  # type: ignore[misc]
+
 
 class TestMoneyComparison:
     """Tests for Money comparison operations."""
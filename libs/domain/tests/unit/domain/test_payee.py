@@ -67,6 +67,14 @@ class TestPayeeCreate:
         assert before <= payee.created_at <= after
         assert before <= payee.updated_at <= after
 
+    def test_create_uses_supplied_timestamp(self, user_id: UserId):
+        """A caller-supplied timestamp is used for both audit fields."""
+        now = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+        payee = Payee.create(user_id=user_id, name="Test", now=now)
+
+        assert payee.created_at == now
+        assert payee.updated_at == now
+
     def test_create_with_default_category(
         self, user_id: UserId, category_id: CategoryId
     ):
@@ -217,6 +225,16 @@ class TestPayeeUpdate:
 
         assert payee.updated_at >= original_updated_at
 
+    def test_record_usage_uses_one_timestamp(self, user_id: UserId):
+        """record_usage() stamps last_used_at and updated_at identically."""
+        payee = Payee.create(user_id=user_id, name="Test")
+        now = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+
+        payee.record_usage(now=now)
+
+        assert payee.last_used_at == now
+        assert payee.updated_at == now
+
 
 # --- TestPayeeNormalization ---
 